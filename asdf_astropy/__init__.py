@@ -1 +1,2 @@
 from ._version import version as __version__  # noqa: F401
+from .config import config_context, get_config  # noqa: F401
@@ -0,0 +1,159 @@
+"""
+Helpers for the optional dask array backend.
+
+dask is not a dependency of asdf-astropy, it is only imported when the
+``array_backend`` option is set to ``"dask"`` or when writing data that
+already is a dask array.
+"""
+
+import sys
+import tempfile
+
+import numpy as np
+
+from asdf_astropy._blocks import read_block_headers, url_to_path
+
+
+def import_dask_array():
+    """
+    Import `dask.array`, raising an informative error if dask is missing.
+    """
+    try:
+        import dask.array as da
+    except ImportError as err:
+        msg = "The 'dask' array backend requires dask to be installed"
+        raise ImportError(msg) from err
+
+    return da
+
+
+def is_dask_array(obj):
+    """
+    Check if an object is a dask array without importing dask.
+    """
+    da = sys.modules.get("dask.array")
+    return da is not None and isinstance(obj, da.Array)
+
+
+def memmap_block(ndarray, ctx):
+    """
+    Memory map the data of an ndarray node directly from the file.
+
+    Only contiguous arrays stored in an uncompressed internal block of a
+    local file are supported.  The map uses its own file handle so it
+    stays valid after the `asdf.AsdfFile` is closed.
+
+    Parameters
+    ----------
+    ndarray : asdf.tags.core.ndarray.NDArrayType
+        The ndarray node.
+    ctx : asdf.extension.SerializationContext
+        The context of the file being read.
+
+    Returns
+    -------
+    numpy.memmap or None
+        The array, or `None` if the node cannot be mapped.
+    """
+    # These attributes are private to asdf, if any are missing
+    # fall back to reading the array through asdf.
+    source = getattr(ndarray, "_source", None)
+    offset = getattr(ndarray, "_offset", None)
+    if (
+        not isinstance(source, int)
+        or not isinstance(offset, int)
+        or getattr(ndarray, "_strides", 0) is not None
+        or getattr(ndarray, "_mask", 0) is not None
+    ):
+        return None
+
+    path = url_to_path(getattr(ctx, "url", None))
+    if path is None or not path.is_file():
+        return None
+
+    headers = read_block_headers(path)
+    if source >= len(headers) or headers[source].streamed or headers[source].compression is not None:
+        return None
+
+    shape = tuple(ndarray.shape)
+    dtype = np.dtype(ndarray.dtype)
+    nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+    if nbytes == 0 or offset + nbytes > headers[source].data_size:
+        return None
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=headers[source].data_offset + offset,
+        shape=shape,
+        order=getattr(ndarray, "_order", "C"),
+    )
+
+
+def to_dask(ndarray, ctx, chunks):
+    """
+    Build a dask array from an ndarray node.
+
+    Uncompressed blocks are memory mapped, so that each chunk only reads
+    its part of the block.  Other blocks are read in full by asdf.
+
+    Parameters
+    ----------
+    ndarray : asdf.tags.core.ndarray.NDArrayType
+        The ndarray node.
+    ctx : asdf.extension.SerializationContext
+        The context of the file being read.
+    chunks : str, int or tuple
+        The chunks of the dask array, see `dask.array.from_array`.
+
+    Returns
+    -------
+    dask.array.Array
+    """
+    da = import_dask_array()
+
+    data = memmap_block(ndarray, ctx)
+    if data is None:
+        data = ndarray._make_array()
+
+    return da.from_array(data, chunks=chunks)
+
+
+def _store(array):
+    with tempfile.TemporaryFile() as fd:
+        out = np.memmap(fd, dtype=array.dtype, mode="w+", shape=array.shape)
+
+    import_dask_array().store(array, out)
+    return out
+
+
+def store_to_memmap(array):
+    """
+    Compute a dask array into a temporary memory-mapped file.
+
+    The chunks are computed and written one at a time, so the array does
+    not need to fit in memory.
+
+    Parameters
+    ----------
+    array : dask.array.Array
+
+    Returns
+    -------
+    numpy.ndarray or numpy.ma.MaskedArray
+        The computed array, backed by the temporary file which is deleted
+        once the array is no longer used.
+    """
+    da = import_dask_array()
+
+    if any(np.isnan(size) for size in array.shape):
+        array = array.compute_chunk_sizes()
+
+    if array.size == 0:
+        return array.compute()
+
+    if isinstance(array._meta, np.ma.MaskedArray):
+        return np.ma.MaskedArray(_store(da.ma.getdata(array)), mask=_store(da.ma.getmaskarray(array)))
+
+    return _store(array)
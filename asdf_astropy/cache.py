@@ -0,0 +1,215 @@
+"""
+On-disk cache of objects read from ASDF files.
+
+Converting a large transform, such as the forward transform of a
+pipeline WCS, runs a converter for every model in it.  `read_cached`
+stores the converted object in a cache keyed by a hash of the file,
+so files that are read again and again only pay the cost of
+conversion once::
+
+    from asdf_astropy.cache import read_cached
+
+    transform = read_cached("pipeline.asdf", ("wcs", "forward_transform"))
+
+The hash covers the YAML tree and the block headers of the file, not the
+block data, so looking up an object in a large file does not read its
+arrays.
+
+The cached objects are stored with `pickle`, and loading a pickle can run
+arbitrary code.  The cache directory is therefore only used when it is
+owned by the current user and cannot be written by anyone else.
+"""
+
+import hashlib
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+from asdf_astropy._blocks import read_block_headers
+
+__all__ = ["clear_cache", "default_cache_dir", "read_cached"]
+
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def default_cache_dir():
+    """
+    Return the default cache directory.
+
+    This is ``asdf_astropy`` in ``$XDG_CACHE_HOME``, or in ``~/.cache`` if
+    that variable is not set.
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "asdf_astropy"
+
+
+def _versions():
+    import asdf
+    import astropy
+
+    from asdf_astropy import __version__
+
+    # Converters from any installed extension package may have built
+    # the object, for example gwcs for a pipeline WCS.
+    packages = sorted(
+        {(ext.package_name, ext.package_version) for ext in asdf.get_config().extensions if ext.package_name},
+    )
+
+    return (
+        f"python={sys.version_info[:2]} asdf={asdf.__version__} "
+        f"astropy={astropy.__version__} asdf-astropy={__version__} packages={packages}"
+    )
+
+
+def _options(kwargs):
+    from asdf_astropy.config import get_config
+
+    options = dict(kwargs)
+    if "extensions" in options:
+        extensions = options["extensions"]
+        if not isinstance(extensions, list | tuple):
+            extensions = [extensions]
+        # Describe extensions by class and URI, as their repr differs
+        # between processes
+        options["extensions"] = [
+            (type(ext).__module__, type(ext).__qualname__, getattr(ext, "extension_uri", None)) for ext in extensions
+        ]
+
+    return f"open={sorted(options.items())!r} config={get_config()!r}"
+
+
+def _hash_range(digest, fd, offset, size):
+    fd.seek(offset)
+    while size > 0 and (chunk := fd.read(min(size, _HASH_CHUNK_SIZE))):
+        digest.update(chunk)
+        size -= len(chunk)
+
+
+def _hash_file(digest, filename):
+    size = Path(filename).stat().st_size
+    headers = read_block_headers(filename)
+    with open(filename, "rb") as fd:
+        _hash_range(digest, fd, 0, headers[0].offset if headers else size)
+        for header in headers:
+            digest.update(repr((header.flags, header.compression, header.allocated_size, header.data_size)).encode())
+            # The block data is identified by its checksum, only blocks
+            # written without one are read in full.
+            if any(header.checksum) and not header.streamed:
+                digest.update(header.checksum)
+            else:
+                end = size if header.streamed else header.data_offset + header.used_size
+                _hash_range(digest, fd, header.data_offset, end - header.data_offset)
+
+
+def _cache_key(filename, path, kwargs):
+    digest = hashlib.sha256()
+    digest.update(_versions().encode())
+    digest.update(_options(kwargs).encode())
+    digest.update(repr(path).encode())
+    _hash_file(digest, filename)
+
+    return digest.hexdigest()
+
+
+def _check_cache_dir(cache_dir):
+    if not hasattr(os, "getuid"):
+        return
+
+    mode = cache_dir.stat()
+    if mode.st_uid != os.getuid() or mode.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        msg = f"Cache directory {cache_dir} must be owned by the current user and not writable by others"
+        raise PermissionError(msg)
+
+
+def _get_item(tree, path):
+    node = tree
+    for key in path:
+        node = node[key]
+
+    return node
+
+
+def read_cached(filename, path, cache_dir=None, **kwargs):
+    """
+    Read an object from an ASDF file, using an on-disk cache.
+
+    The cache key is a hash of the YAML tree and block headers of the
+    file, ``path``, the ``kwargs``, the `asdf_astropy.config` options and
+    the versions of Python, asdf, astropy and the installed asdf extension
+    packages, so a modified file, other options or an upgrade never return
+    a stale object.  The block data is identified by the checksums in the
+    block headers and only read for blocks written without a checksum.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The ASDF file.
+    path : str or tuple
+        Key of the object in the tree, or a sequence of keys and indices
+        for a nested object.
+    cache_dir : str or pathlib.Path, optional
+        The cache directory, defaults to `default_cache_dir`.
+    **kwargs
+        Passed to `asdf.open` when the object is not in the cache.
+
+    Returns
+    -------
+    object
+        The object, which must be picklable.  Arrays are read in full so
+        the object does not depend on the file.
+    """
+    import asdf
+
+    if isinstance(path, str):
+        path = (path,)
+    path = tuple(path)
+
+    cache_dir = Path(default_cache_dir() if cache_dir is None else cache_dir)
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _check_cache_dir(cache_dir)
+
+    cache_file = cache_dir / f"{_cache_key(filename, path, kwargs)}.pickle"
+    if cache_file.is_file():
+        with open(cache_file, "rb") as fd:
+            return pickle.load(fd)  # noqa: S301
+
+    kwargs.setdefault("lazy_load", False)
+    kwargs.setdefault("memmap", False)
+    with asdf.open(filename, **kwargs) as af:
+        obj = _get_item(af.tree, path)
+
+    # Write to a temporary file first so that other processes never
+    # read a partially written cache file
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            pickle.dump(obj, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp_name).replace(cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return obj
+
+
+def clear_cache(cache_dir=None):
+    """
+    Remove all cached objects, leaving any other files in the directory.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path, optional
+        The cache directory, defaults to `default_cache_dir`.
+    """
+    cache_dir = Path(default_cache_dir() if cache_dir is None else cache_dir)
+    for pattern in ("*.pickle", "*.tmp"):
+        for cache_file in cache_dir.glob(pattern):
+            cache_file.unlink(missing_ok=True)
@@ -0,0 +1,243 @@
+"""
+Methods for getting and setting asdf-astropy configuration options.
+"""
+
+import copy
+import threading
+from contextlib import contextmanager
+
+__all__ = ["AsdfAstropyConfig", "config_context", "get_config"]
+
+
+DEFAULT_DECOMPRESSION_THREADS = None
+DEFAULT_LAZY_QUANTITY = False
+DEFAULT_ARRAY_BACKEND = "numpy"
+DEFAULT_DASK_CHUNKS = "auto"
+DEFAULT_TRUSTED_READ = False
+DEFAULT_PACKED_REPRESENTATIONS = False
+
+_ARRAY_BACKENDS = ("numpy", "dask")
+
+
+class AsdfAstropyConfig:
+    """
+    Container for asdf-astropy configuration options.  Users are not intended
+    to construct this object directly; instead, use the
+    `asdf_astropy.config.get_config` and `asdf_astropy.config.config_context`
+    module methods.
+    """
+
+    def __init__(self):
+        self._decompression_threads = DEFAULT_DECOMPRESSION_THREADS
+        self._lazy_quantity = DEFAULT_LAZY_QUANTITY
+        self._array_backend = DEFAULT_ARRAY_BACKEND
+        self._dask_chunks = DEFAULT_DASK_CHUNKS
+        self._trusted_read = DEFAULT_TRUSTED_READ
+        self._packed_representations = DEFAULT_PACKED_REPRESENTATIONS
+
+    @property
+    def decompression_threads(self):
+        """
+        Number of threads used to decompress the column blocks of a table
+        when reading.  When `None` (the default) blocks are decompressed
+        one at a time as the columns are converted.
+
+        Only blocks compressed with the ``zlib``, ``bzp2`` or ``lz4``
+        codecs in files opened from a local path are decompressed in
+        parallel; other blocks are read as usual.
+
+        The parallel blocks are read by asdf-astropy rather than asdf.  It
+        parses the block headers itself and finds the block of each column
+        from attributes of the asdf ndarray nodes that are private to asdf,
+        so it depends on the layout of the blocks and on the asdf version.
+        Checksums are validated when the file is opened with
+        ``validate_checksums=True``, as asdf does.
+
+        Returns
+        -------
+        int or None
+        """
+        return self._decompression_threads
+
+    @decompression_threads.setter
+    def decompression_threads(self, value):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            msg = "decompression_threads must be a positive integer or None"
+            raise ValueError(msg)
+        self._decompression_threads = value
+
+    @property
+    def lazy_quantity(self):
+        """
+        Flag that controls if quantities stored in binary blocks are read
+        as `asdf_astropy.lazy.LazyQuantity` proxies, which only read the
+        block when the values are accessed.  Off by default.
+
+        Angles and other subclasses of `~astropy.units.Quantity` are not
+        deferred.  Quantities that are part of tables, representations and
+        models are read when those objects are built.
+
+        Returns
+        -------
+        bool
+        """
+        return self._lazy_quantity
+
+    @lazy_quantity.setter
+    def lazy_quantity(self, value):
+        self._lazy_quantity = value
+
+    @property
+    def array_backend(self):
+        """
+        Array library used for the data of table columns when reading,
+        either ``"numpy"`` (the default) or ``"dask"``.
+
+        With ``"dask"`` columns are read as dask arrays with chunks set by
+        `dask_chunks`, which astropy tables hold as mixin columns.  Columns
+        stored in uncompressed blocks of local files are memory mapped so
+        each chunk only reads its part of the block.  This requires dask.
+
+        Table columns that are dask arrays are always written chunk by
+        chunk, whatever the value of this option.
+
+        Returns
+        -------
+        str
+        """
+        return self._array_backend
+
+    @array_backend.setter
+    def array_backend(self, value):
+        if value not in _ARRAY_BACKENDS:
+            msg = f"array_backend must be one of {', '.join(repr(b) for b in _ARRAY_BACKENDS)}"
+            raise ValueError(msg)
+        self._array_backend = value
+
+    @property
+    def dask_chunks(self):
+        """
+        Chunks of the dask arrays read with the ``"dask"`` `array_backend`,
+        in any form accepted by ``dask.array.from_array``.  Defaults to
+        ``"auto"``.
+
+        Returns
+        -------
+        str, int or tuple
+        """
+        return self._dask_chunks
+
+    @dask_chunks.setter
+    def dask_chunks(self, value):
+        self._dask_chunks = value
+
+    @property
+    def trusted_read(self):
+        """
+        Flag that controls if latitudes and longitudes are read without
+        the checks done when constructing them.  Off by default.
+
+        Constructing a `~astropy.coordinates.Latitude` checks that every
+        value is within [-90, 90] degrees, and constructing a
+        `~astropy.coordinates.Longitude` wraps every value at its
+        ``wrap_angle``.  Both are full passes over the data that are
+        redundant for files written by asdf-astropy, which only stores
+        valid angles.  Only enable this for files from a trusted source,
+        as invalid values are read as is.
+
+        This only applies to the latitudes and longitudes stored on their
+        own.  Representations, frames and `~astropy.coordinates.SkyCoord`
+        objects build their components through the angle classes again,
+        which checks or wraps the values once whatever this option.
+
+        Returns
+        -------
+        bool
+        """
+        return self._trusted_read
+
+    @trusted_read.setter
+    def trusted_read(self, value):
+        self._trusted_read = value
+
+    @property
+    def packed_representations(self):
+        """
+        Flag that controls if the components of coordinate representations
+        are written to a single binary block.  Off by default.
+
+        When enabled, components that are arrays of the same shape and
+        dtype are written as views of one array with the components
+        stacked along its first axis, so that reading all of them is a
+        single sequential read.  The file layout is otherwise unchanged
+        and can be read by any version of asdf-astropy.
+
+        Returns
+        -------
+        bool
+        """
+        return self._packed_representations
+
+    @packed_representations.setter
+    def packed_representations(self, value):
+        self._packed_representations = value
+
+    def reset(self):
+        """
+        Reset all configuration options to their default values.
+        """
+        self.__init__()
+
+    def __repr__(self):
+        return (
+            "<AsdfAstropyConfig\n"
+            f"  decompression_threads: {self.decompression_threads}\n"
+            f"  lazy_quantity: {self.lazy_quantity}\n"
+            f"  array_backend: {self.array_backend}\n"
+            f"  dask_chunks: {self.dask_chunks}\n"
+            f"  trusted_read: {self.trusted_read}\n"
+            f"  packed_representations: {self.packed_representations}\n"
+            ">"
+        )
+
+
+class _ConfigLocal(threading.local):
+    def __init__(self):
+        self.config_stack = []
+
+
+_global_config = AsdfAstropyConfig()
+_local = _ConfigLocal()
+
+
+def get_config():
+    """
+    Get the current config, which may have been altered by
+    one or more surrounding calls to `asdf_astropy.config.config_context`.
+
+    Returns
+    -------
+    asdf_astropy.config.AsdfAstropyConfig
+    """
+    if len(_local.config_stack) == 0:
+        return _global_config
+
+    return _local.config_stack[-1]
+
+
+@contextmanager
+def config_context():
+    """
+    Context manager that temporarily overrides asdf-astropy configuration.
+    The context yields an `asdf_astropy.config.AsdfAstropyConfig` instance
+    that can be modified without affecting code outside of the context.
+    """
+    base_config = _global_config if len(_local.config_stack) == 0 else _local.config_stack[-1]
+
+    config = copy.copy(base_config)
+    _local.config_stack.append(config)
+
+    try:
+        yield config
+    finally:
+        _local.config_stack.pop()
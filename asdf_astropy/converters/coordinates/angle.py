@@ -1,4 +1,18 @@
-from asdf_astropy.converters.unit.quantity import QuantityConverter
+from asdf_astropy.config import get_config
+from asdf_astropy.converters.unit.quantity import QuantityConverter, copy_if_needed
+
+
+def _is_trusted(quantity):
+    """
+    Check if an angle can be built as a view of ``quantity``, skipping the
+    checks done by the angle constructors.
+
+    Representations build their components with the angle constructors,
+    so angles that are components of a representation are checked again.
+    """
+    from astropy.utils.masked import Masked
+
+    return get_config().trusted_read and not isinstance(quantity, Masked)
 
 
 class AngleConverter(QuantityConverter):
@@ -12,7 +26,7 @@ class AngleConverter(QuantityConverter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.coordinates.angles import Angle
 
-        return Angle(super().from_yaml_tree(node, tag, ctx))
+        return Angle(super().from_yaml_tree(node, tag, ctx), copy=copy_if_needed())
 
 
 class LatitudeConverter(QuantityConverter):
@@ -26,7 +40,11 @@ class LatitudeConverter(QuantityConverter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.coordinates.angles import Latitude
 
-        return Latitude(super().from_yaml_tree(node, tag, ctx))
+        quantity = super().from_yaml_tree(node, tag, ctx)
+        if _is_trusted(quantity):
+            return quantity.view(Latitude)
+
+        return Latitude(quantity, copy=copy_if_needed())
 
 
 class LongitudeConverter(QuantityConverter):
@@ -43,6 +61,13 @@ class LongitudeConverter(QuantityConverter):
         return tree
 
     def from_yaml_tree(self, node, tag, ctx):
-        from astropy.coordinates.angles import Longitude
+        from astropy.coordinates.angles import Angle, Longitude
+
+        quantity = super().from_yaml_tree(node, tag, ctx)
+        if _is_trusted(quantity):
+            # Setting the wrap_angle property would wrap the values again
+            longitude = quantity.view(Longitude)
+            longitude._wrap_angle = Angle(node["wrap_angle"], copy=copy_if_needed())
+            return longitude
 
-        return Longitude(super().from_yaml_tree(node, tag, ctx), wrap_angle=node["wrap_angle"])
+        return Longitude(quantity, wrap_angle=node["wrap_angle"], copy=copy_if_needed())
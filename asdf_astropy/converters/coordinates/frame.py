@@ -3,10 +3,102 @@ from asdf.extension import Converter
 from asdf_astropy.converters.utils import import_type
 
 
+def _broadcast_axes(value):
+    """
+    Axes along which an array valued frame attribute is a broadcast view,
+    that is, axes with more than one element and a stride of zero.
+    """
+    import numpy as np
+    from astropy.coordinates import BaseRepresentationOrDifferential
+    from astropy.time import Time
+
+    if isinstance(value, Time):
+        arrays = [value.jd1, value.jd2]
+    elif isinstance(value, BaseRepresentationOrDifferential):
+        arrays = [getattr(value, component) for component in value.components]
+    else:
+        arrays = [value]
+
+    shape = getattr(value, "shape", ())
+    if not shape or any(not isinstance(array, np.ndarray) or array.shape != shape for array in arrays):
+        return ()
+
+    return tuple(
+        axis for axis, size in enumerate(shape) if size > 1 and all(array.strides[axis] == 0 for array in arrays)
+    )
+
+
+def _equals_default(value, default):
+    """
+    Check if a frame attribute read from a file is exactly the default
+    value of the attribute, with the same type, scale, format and unit.
+    """
+    import numpy as np
+    from astropy.time import Time
+    from astropy.units import Quantity
+
+    if value is default:
+        return True
+
+    if type(value) is not type(default) or np.shape(value) != () or np.shape(default) != ():
+        return False
+
+    if isinstance(value, Time):
+        return (
+            value.scale == default.scale
+            and value.format == default.format
+            and value.location is None
+            and default.location is None
+            and value.jd1 == default.jd1
+            and value.jd2 == default.jd2
+        )
+
+    if isinstance(value, Quantity):
+        return value.unit == default.unit and bool(np.all(value.value == default.value))
+
+    return False
+
+
+def _unbroadcast_attributes(frame, frame_attributes):
+    """
+    Replace the frame attributes that are broadcast views by the part of
+    them that is not repeated.
+
+    The frame broadcasts its attributes again when it is built on read, so
+    the broadcast copies are neither written nor materialized.  The
+    attributes are returned unchanged if the compact values would not
+    broadcast back to the shape of the frame.
+    """
+    import numpy as np
+
+    compact = {}
+    for attr, value in frame_attributes.items():
+        if axes := _broadcast_axes(value):
+            compact[attr] = value[tuple(slice(0, 1) if axis in axes else slice(None) for axis in range(value.ndim))]
+        else:
+            compact[attr] = value
+
+    shapes = [getattr(value, "shape", ()) for value in compact.values()]
+    if frame.has_data:
+        shapes.append(frame.data.shape)
+
+    if np.broadcast_shapes(*shapes) != frame.shape:
+        return frame_attributes
+
+    return compact
+
+
+# Maximum number of attribute values remembered by FrameConverter as
+# being, or not being, the default value of their attribute
+_DEFAULT_MATCHES_SIZE = 256
+
+
 class FrameConverter(Converter):
     def __init__(self, tags, frame_type_name):
         self._frame_type_name = frame_type_name
         self._frame_type = None
+        self._frame_attribute_defaults = None
+        self._default_matches = {}
 
         if isinstance(tags, str):
             tags = [tags]
@@ -28,6 +120,65 @@ class FrameConverter(Converter):
             self._frame_type = import_type(self._frame_type_name)
         return self._frame_type
 
+    @property
+    def frame_attribute_defaults(self):
+        # The attributes accepted by the frame class and their defaults,
+        # looked up once rather than for every frame.
+        if self._frame_attribute_defaults is None:
+            self._frame_attribute_defaults = self.frame_type.get_frame_attr_defaults()
+        return self._frame_attribute_defaults
+
+    def _is_default(self, attr, value):
+        import numpy as np
+
+        # Defaults are scalars, so array values never match them.  Checking
+        # that first also keeps large arrays out of the memo below.
+        if np.shape(value) != ():
+            return False
+
+        # Files with many frames share the attribute values between them
+        # (asdf writes repeated objects once), so remember the result
+        # for each value object.
+        key = (attr, id(value))
+        if (match := self._default_matches.get(key)) is not None and match[0] is value:
+            return match[1]
+
+        is_default = _equals_default(value, self.frame_attribute_defaults[attr])
+        if len(self._default_matches) >= _DEFAULT_MATCHES_SIZE:
+            self._default_matches.clear()
+        # Keep a reference to the value so that its id is not reused
+        self._default_matches[key] = (value, is_default)
+
+        return is_default
+
+    def _split_defaults(self, frame_attributes):
+        # Frame attributes are validated each time they are passed to a
+        # frame.  Split off those with the default value of the frame class,
+        # the frame uses the default for them without validating it again.
+        defaults = self.frame_attribute_defaults
+        frame_kwargs = {}
+        default_attributes = {}
+        for attr, value in frame_attributes.items():
+            if attr in defaults and self._is_default(attr, value):
+                default_attributes[attr] = value
+            else:
+                frame_kwargs[attr] = value
+
+        return frame_kwargs, default_attributes
+
+    @staticmethod
+    def _set_default_attributes(frame, default_attributes):
+        # The file stores every attribute, so those split off were set
+        # explicitly when the frame was written.  Record them on the frame
+        # as the frame class does for attributes passed to it (a scalar
+        # equal to the default validates to the same object), so that they
+        # are not reported as defaults and are kept by transformations.
+        for attr, value in default_attributes.items():
+            setattr(frame, "_" + attr, value)
+            frame._attr_names_with_defaults.remove(attr)
+
+        return frame
+
     def to_yaml_tree(self, obj, tag, ctx):
         node = {}
 
@@ -41,16 +192,20 @@ class FrameConverter(Converter):
             value = getattr(obj, attr, None)
             if value is not None:
                 frame_attributes[attr] = value
-        node["frame_attributes"] = frame_attributes
+        node["frame_attributes"] = _unbroadcast_attributes(obj, frame_attributes)
 
         return node
 
     def from_yaml_tree(self, node, tag, ctx):
+        frame_kwargs, default_attributes = self._split_defaults(node["frame_attributes"])
+
         data = node.get("data", None)
         if data is not None:
-            return self.frame_type(node["data"], **node["frame_attributes"])
+            frame = self.frame_type(node["data"], **frame_kwargs)
+        else:
+            frame = self.frame_type(**frame_kwargs)
 
-        return self.frame_type(**node["frame_attributes"])
+        return self._set_default_attributes(frame, default_attributes)
 
 
 class LegacyICRSConverter(Converter):
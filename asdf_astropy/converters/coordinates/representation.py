@@ -1,5 +1,36 @@
 from asdf.extension import Converter
 
+from asdf_astropy.config import get_config
+from asdf_astropy.converters.unit.quantity import copy_if_needed
+from asdf_astropy.lazy import load_lazy
+
+
+def _pack_components(components):
+    """
+    Replace the components by views of a single array, with the components
+    stacked along its first axis, if they are arrays of the same shape and
+    dtype.
+
+    asdf writes views of the same array to a single binary block.  Each
+    component keeps its class and unit.
+    """
+    import numpy as np
+    from astropy.units import Quantity
+    from astropy.utils.masked import Masked
+
+    values = list(components.values())
+    if (
+        len(values) < 2  # noqa: PLR2004
+        or any(not isinstance(v, Quantity) or isinstance(v, Masked) for v in values)
+        or values[0].ndim == 0
+        or any(v.shape != values[0].shape or v.dtype != values[0].dtype for v in values)
+    ):
+        return components
+
+    packed = np.stack([v.value for v in values])
+
+    return {name: v._new_view(packed[i], v.unit) for i, (name, v) in enumerate(components.items())}
+
 
 class RepresentationConverter(Converter):
     tags = ("tag:astropy.org:astropy/coordinates/representation-*",)
@@ -42,6 +73,9 @@ class RepresentationConverter(Converter):
             if value is not None:
                 components[c] = value
 
+        if get_config().packed_representations:
+            components = _pack_components(components)
+
         return {
             "type": type(obj).__name__,
             "components": components,
@@ -50,4 +84,11 @@ class RepresentationConverter(Converter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.coordinates import representation
 
-        return getattr(representation, node["type"])(**node["components"])
+        components = node["components"]
+        if get_config().lazy_quantity:
+            components = load_lazy(components)
+
+        # The components are already quantities of the right class, build
+        # the representation without copying them so that they remain
+        # views of their (possibly memory-mapped) blocks.
+        return getattr(representation, node["type"])(**components, copy=copy_if_needed())
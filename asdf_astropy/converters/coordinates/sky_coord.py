@@ -1,14 +1,42 @@
 from asdf.extension import Converter
 
+from asdf_astropy.converters.unit.quantity import copy_if_needed
+
 
 class SkyCoordConverter(Converter):
     tags = ("tag:astropy.org:astropy/coordinates/skycoord-*",)
     types = ("astropy.coordinates.sky_coordinate.SkyCoord",)
 
     def to_yaml_tree(self, obj, tag, ctx):
-        return obj.info._represent_as_dict()
+        from astropy.units import Quantity
+
+        node = obj.info._represent_as_dict()
+
+        # asdf writes a view along with the whole array it is a view of,
+        # so store strided components (e.g. of an (n, 3) array) compactly
+        for name, value in node.items():
+            if isinstance(value, Quantity) and not value.flags.c_contiguous:
+                node[name] = value.copy()
+
+        return node
 
     def from_yaml_tree(self, node, tag, ctx):
+        from astropy.coordinates import frame_transform_graph
         from astropy.coordinates.sky_coordinate import SkyCoord
 
-        return SkyCoord.info._construct_from_dict(node)
+        # Equivalent to SkyCoord.info._construct_from_dict, but without
+        # copying the components so that they remain views of their
+        # (possibly memory-mapped) blocks.  SkyCoord copies components
+        # passed as keywords whatever the value of copy, so build the
+        # frame first and pass the attributes that the frame does not
+        # have to the SkyCoord.
+        node = dict(node)
+        frame_cls = frame_transform_graph.lookup_name(node.pop("frame"))
+        skycoord_attributes = {
+            name: node.pop(name)
+            for name in list(node)
+            if name in frame_transform_graph.frame_attributes and name not in frame_cls.frame_attributes
+        }
+
+        frame = frame_cls(**node, copy=copy_if_needed())
+        return SkyCoord(frame, **skycoord_attributes, copy=copy_if_needed())
@@ -4,6 +4,8 @@ import pytest
 from astropy import units as u
 from astropy.coordinates import Angle, Latitude, Longitude
 
+from asdf_astropy import config_context
+
 
 def create_angles():
     return [
@@ -25,3 +27,24 @@ def test_serialization(angle, tmp_path):
 
     with asdf.open(file_path) as af:
         assert (af["angle"] == angle).all()
+
+
+def test_trusted_read(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    latitude = Latitude(np.linspace(-90, 90, 100), u.deg)
+    longitude = Longitude(np.linspace(-180, 180, 100), u.deg, wrap_angle=180 * u.deg)
+    with asdf.AsdfFile() as af:
+        af["latitude"] = latitude
+        af["longitude"] = longitude
+        af.write_to(file_path)
+
+    with config_context() as config:
+        config.trusted_read = True
+        with asdf.open(file_path, memmap=True) as af:
+            for index, (key, expected) in enumerate((("latitude", latitude), ("longitude", longitude))):
+                result = af[key]
+                assert type(result) is type(expected)
+                assert (result == expected).all()
+                assert np.shares_memory(result, af._blocks.blocks[index].data)
+
+            assert af["longitude"].wrap_angle == 180 * u.deg
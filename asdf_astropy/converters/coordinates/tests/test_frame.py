@@ -134,3 +134,90 @@ def test_legacy_icrs_deseialize():
     buff = yaml_to_asdf(f"example: {example.strip()}", version="1.5.0")
     with asdf.open(buff) as af:
         assert_frame_equal(af["example"], truth)
+
+
+def test_broadcast_attributes(tmp_path):
+    obstime = Time(np.linspace(2450000, 2460000, 3)[:, np.newaxis], format="jd")
+    frame = CIRS(ra=np.ones((3, 4)) * u.deg, dec=np.ones((3, 4)) * u.deg, obstime=obstime)
+    assert frame.obstime.shape == (3, 4)
+
+    converter = FrameConverter(
+        "tag:astropy.org:astropy/coordinates/frames/cirs-1.0.0",
+        "astropy.coordinates.builtin_frames.cirs.CIRS",
+    )
+    node = converter.to_yaml_tree(frame, None, None)
+    assert node["frame_attributes"]["obstime"].shape == (3, 1)
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["frame"] = frame
+        af.write_to(file_path)
+
+    with asdf.open(file_path) as af:
+        result = af["frame"]
+        assert_frame_equal(result, frame)
+        assert result.obstime.shape == (3, 4)
+        assert (result.obstime == frame.obstime).all()
+        # The attribute is broadcast again, not copied
+        assert result.obstime.jd1.strides[1] == 0
+
+
+def test_default_attributes(tmp_path):
+    equinox = Time("J2000")
+    frames = [
+        FK5(),
+        FK5(equinox=Time("J2010")),
+        # Same time as the default, but in a different format
+        FK5(equinox=Time(equinox.mjd, format="mjd")),
+    ]
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["frames"] = frames
+        af.write_to(file_path)
+
+    with asdf.open(file_path) as af:
+        result = af["frames"]
+        for frame, expected in zip(result, frames):
+            assert frame.equinox == expected.equinox
+            assert frame.equinox.format == expected.equinox.format
+
+        # Every attribute is stored, so none are read back as defaults
+        for frame in result:
+            assert not frame.is_frame_attr_default("equinox")
+
+
+def test_default_attributes_transform(tmp_path):
+    frame = CIRS(obstime=Time("J2000"))
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["frame"] = frame
+        af.write_to(file_path)
+
+    with asdf.open(file_path) as af:
+        result = af["frame"]
+        assert not result.is_frame_attr_default("obstime")
+
+        # The obstime of the frame is kept, not replaced by that of the coordinate
+        coord = SkyCoord(10 * u.deg, 20 * u.deg, obstime=Time(2020, format="jyear"))
+        expected = coord.transform_to(frame)
+        transformed = coord.transform_to(result)
+        assert transformed.obstime == expected.obstime == frame.obstime
+        assert_frame_equal(transformed.frame, expected.frame)
+
+
+def test_default_attributes_arrays(tmp_path):
+    obstime = Time(np.linspace(50000, 51000, 100), format="mjd")
+    frame = CIRS(np.zeros(100) * u.deg, np.zeros(100) * u.deg, obstime=obstime)
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["frame"] = frame
+        af.write_to(file_path)
+
+    with asdf.open(file_path) as af:
+        converter = af.extension_manager.get_converter_for_type(CIRS).delegate
+        assert (af["frame"].obstime == obstime).all()
+        # Array values are never the default, and are not remembered
+        assert all(np.shape(value) == () for value, _ in converter._default_matches.values())
@@ -1,9 +1,12 @@
 import asdf
 import astropy.units as u
+import numpy as np
 import pytest
 from astropy.coordinates import Angle, representation
 from numpy.random import default_rng
 
+from asdf_astropy import config_context
+from asdf_astropy._blocks import read_block_headers
 from asdf_astropy.testing.helpers import assert_representation_equal
 
 IGNORED_REPRESENTATION_CLASSES = [
@@ -40,3 +43,28 @@ def test_serialization(rep_class, tmp_path):
 
     with asdf.open(file_path) as af:
         assert_representation_equal(af["rep"], rep)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_memmap_views(packed, tmp_path):
+    rep = create_representation(representation.SphericalRepresentation)
+    file_path = tmp_path / "test.asdf"
+
+    with config_context() as config:
+        config.packed_representations = packed
+        with asdf.AsdfFile() as af:
+            af["rep"] = rep
+            af.write_to(file_path)
+
+    # Packed components are stored in a single block
+    assert len(read_block_headers(file_path)) == (1 if packed else 3)
+
+    with asdf.open(file_path, memmap=True) as af:
+        result = af["rep"]
+        assert_representation_equal(result, rep)
+
+        blocks = [block.data for block in af._blocks.blocks]
+        for component in result.components:
+            value = getattr(result, component)
+            assert type(value) is type(getattr(rep, component))
+            assert any(np.shares_memory(value, block) for block in blocks)
@@ -1,9 +1,13 @@
+import unittest.mock as mk
+
 import asdf
 import astropy.units as u
 import numpy as np
 import pytest
-from astropy.coordinates import FK4, ICRS, Galactic, Longitude, SkyCoord
+from astropy.coordinates import FK4, ICRS, Galactic, Latitude, Longitude, SkyCoord
 
+from asdf_astropy import config_context
+from asdf_astropy._blocks import read_block_headers
 from asdf_astropy.testing.helpers import assert_sky_coord_equal
 
 
@@ -76,3 +80,68 @@ def test_serializaton_extra_attribute(tmp_path):
     with asdf.open(file_path) as af:
         assert_sky_coord_equal(af["coord"], coord)
         assert hasattr(af["coord"], "equinox")
+
+
+def test_memmap_views(tmp_path):
+    coord = SkyCoord(np.linspace(0, 359, 1000) * u.deg, np.linspace(-89, 89, 1000) * u.deg, frame="icrs")
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["coord"] = coord
+        af.write_to(file_path)
+
+    with asdf.open(file_path, memmap=True) as af:
+        result = af["coord"]
+        assert_sky_coord_equal(result, coord)
+
+        # The frame properties (ra, dec) are computed from the data, so
+        # check the components of the data itself
+        blocks = [block.data for block in af._blocks.blocks]
+        for value in (result.data.lon, result.data.lat):
+            assert any(np.shares_memory(value, block) for block in blocks)
+
+
+def test_strided_components(tmp_path):
+    data = np.random.default_rng(0).uniform(0, 80, (1000, 3))
+    frame = ICRS(
+        u.Quantity(data[:, 0], u.deg, copy=False),
+        u.Quantity(data[:, 1], u.deg, copy=False),
+        copy=False,
+    )
+    coord = SkyCoord(frame, copy=False)
+    assert not coord.data.lon.flags.c_contiguous
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["coord"] = coord
+        af.write_to(file_path)
+
+    # Each component is written on its own, not along with the whole array
+    assert [header.data_size for header in read_block_headers(file_path)] == [1000 * 8] * 2
+
+    with asdf.open(file_path) as af:
+        assert_sky_coord_equal(af["coord"], coord)
+
+
+@pytest.mark.parametrize(("trusted_read", "n_checks"), [(False, 2), (True, 1)])
+def test_trusted_read(tmp_path, trusted_read, n_checks):
+    coord = SkyCoord(np.linspace(0, 360, 100), np.linspace(-90, 90, 100), unit="deg")
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["coord"] = coord
+        af.write_to(file_path)
+
+    with (
+        config_context() as config,
+        mk.patch.object(Latitude, "_validate_angles", autospec=True, side_effect=Latitude._validate_angles) as validate,
+        mk.patch.object(Longitude, "_wrap_at", autospec=True, side_effect=Longitude._wrap_at) as wrap,
+    ):
+        config.trusted_read = trusted_read
+        with asdf.open(file_path) as af:
+            assert_sky_coord_equal(af["coord"], coord)
+
+    # trusted_read skips the checks of the Latitude and Longitude
+    # converters, but not the one when the frame builds its representation
+    assert validate.call_count == n_checks
+    assert wrap.call_count == n_checks
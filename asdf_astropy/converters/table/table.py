@@ -1,6 +1,11 @@
 from asdf.extension import Converter
 from asdf.tags.core.ndarray import NDArrayType
 
+from asdf_astropy._blocks import submit_read
+from asdf_astropy._dask import is_dask_array, store_to_memmap, to_dask
+from asdf_astropy.config import get_config
+from asdf_astropy.lazy import load_lazy
+
 
 class ColumnConverter(Converter):
     tags = (
@@ -27,23 +32,62 @@ class ColumnConverter(Converter):
         return node
 
     def from_yaml_tree(self, node, tag, ctx):
-        from astropy.table import Column, MaskedColumn
-        from numpy.ma.core import MaskedArray
-
         data = node["data"]
         if isinstance(data, NDArrayType):
+            config = get_config()
+            if config.array_backend == "dask":
+                return self._make_dask_column(node, to_dask(data, ctx, config.dask_chunks))
+
+            max_workers = config.decompression_threads
+            if max_workers and (read := submit_read(data, ctx, max_workers)) is not None:
+                return self._from_yaml_tree_parallel(node, *read)
+
             # TODO: Why doesn't NDArrayType work?  This needs some research
             # and documentation.
             data = data._make_array()
 
+        return self._make_column(node, data)
+
+    def _from_yaml_tree_parallel(self, node, data, future):
+        # The block is decompressed into data by a worker thread while
+        # the rest of the tree is converted, asdf resumes this generator
+        # once the whole tree has been converted.  Until then the column
+        # holds uninitialized data, so the future is kept on the column
+        # for the table converters to wait on, see _wait_for_columns.
+        column = self._make_column(node, data)
+        column._asdf_astropy_future = future
+        yield column
+
+        future.result()
+        del column._asdf_astropy_future
+
+    def _make_dask_column(self, node, data):
+        from astropy.table.mixins.dask import as_dask_column
+
+        column = as_dask_column(data)
+        column.info.name = node["name"]
+        for attr in ("description", "unit", "meta"):
+            if attr in node:
+                setattr(column.info, attr, node[attr])
+
+        return column
+
+    def _make_column(self, node, data):
+        from astropy.table import Column, MaskedColumn
+        from numpy.ma.core import MaskedArray
+
         column_class = MaskedColumn if isinstance(data, MaskedArray) else Column
 
+        # Avoid copying the block data so that columns read from a
+        # memory-mapped file remain views and are only paged in when
+        # the column values are accessed.
         return column_class(
             data=data,
             name=node["name"],
             description=node.get("description"),
             unit=node.get("unit"),
             meta=node.get("meta"),
+            copy=False,
         )
 
 
@@ -61,7 +105,8 @@ class AsdfTableConverter(Converter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.table import Table
 
-        return Table(node["columns"], meta=node.get("meta"))
+        _wait_for_columns(node["columns"])
+        return Table(node["columns"], meta=node.get("meta"), copy=False)
 
 
 class AstropyTableConverter(Converter):
@@ -75,7 +120,7 @@ class AstropyTableConverter(Converter):
         from astropy.table import QTable
 
         node = {
-            "columns": [obj[name] for name in obj.colnames],
+            "columns": [_writable_column(obj[name]) for name in obj.colnames],
             "colnames": obj.colnames,
             "qtable": isinstance(obj, QTable),
         }
@@ -88,12 +133,22 @@ class AstropyTableConverter(Converter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.table import QTable, Table
 
-        table = QTable(meta=node.get("meta")) if node.get("qtable", False) else Table(meta=node.get("meta"))
+        table_class = QTable if node.get("qtable", False) else Table
 
-        for name, column in zip(node["colnames"], node["columns"]):
-            table[name] = column
+        columns = node["columns"]
+        if get_config().lazy_quantity:
+            columns = load_lazy(columns)
+        _wait_for_columns(columns)
 
-        return table
+        # Build the table in a single call with copy=False, adding the
+        # columns one at a time copies each of them (and so reads every
+        # block in full even if the file was opened with memmap=True).
+        return table_class(
+            list(columns),
+            names=node["colnames"],
+            meta=node.get("meta"),
+            copy=False,
+        )
 
 
 class NdarrayMixinConverter(Converter):
@@ -112,3 +167,37 @@ class NdarrayMixinConverter(Converter):
 
         # this will trigger reading the ASDF block that contains the array data
         return arr.view(NdarrayMixin)
+
+
+def _wait_for_columns(columns):
+    """
+    Wait for the columns decompressed on worker threads, so that the table
+    is complete when it is returned to converters that use it.
+    """
+    for column in columns:
+        if (future := getattr(column, "_asdf_astropy_future", None)) is not None:
+            future.result()
+
+
+def _writable_column(column):
+    """
+    Replace dask columns, which have no converter, by columns backed by a
+    temporary file that the dask array is computed into chunk by chunk.
+    """
+    if not is_dask_array(column):
+        return column
+
+    from astropy.table import Column, MaskedColumn
+    from numpy.ma import MaskedArray
+
+    data = store_to_memmap(column)
+    column_class = MaskedColumn if isinstance(data, MaskedArray) else Column
+
+    return column_class(
+        data=data,
+        name=column.info.name,
+        description=column.info.description,
+        unit=column.info.unit,
+        meta=column.info.meta,
+        copy=False,
+    )
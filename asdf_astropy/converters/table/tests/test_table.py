@@ -1,3 +1,4 @@
+import unittest.mock as mk
 import warnings
 
 import asdf
@@ -6,10 +7,13 @@ import numpy as np
 import pytest
 from asdf.testing.helpers import yaml_to_asdf
 from astropy.coordinates import EarthLocation, SkyCoord
-from astropy.table import NdarrayMixin, QTable, Table
+from astropy.table import MaskedColumn, NdarrayMixin, QTable, Table
 from astropy.time import Time, TimeDelta
 from numpy.testing import assert_array_equal
 
+from asdf_astropy import config_context
+from asdf_astropy._blocks import _BLOCK_HEADER, _BLOCK_PREFIX, read_block_headers, submit_read
+from asdf_astropy.converters.table import AstropyTableConverter, ColumnConverter
 from asdf_astropy.testing import helpers
 
 
@@ -111,6 +115,196 @@ def test_table_row_order(tmp_path):
     helpers.assert_table_roundtrip(table, tmp_path)
 
 
+@pytest.mark.parametrize("table_class", [Table, QTable])
+def test_table_columns_not_copied(table_class):
+    data = {"a": np.arange(5), "b": np.linspace(0, 1, 5)}
+    columns = [
+        ColumnConverter().from_yaml_tree({"data": value, "name": name}, "tag:stsci.edu:asdf/core/column-1.0.0", None)
+        for name, value in data.items()
+    ]
+    node = {"columns": columns, "colnames": list(data), "qtable": table_class is QTable}
+
+    table = AstropyTableConverter().from_yaml_tree(node, "tag:astropy.org:astropy/table/table-1.1.0", None)
+
+    assert isinstance(table, table_class)
+    assert table.colnames == list(data)
+    for name, value in data.items():
+        assert np.shares_memory(table[name], value)
+
+
+def test_table_memmap(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    table = Table({"a": np.arange(10), "b": np.linspace(0, 1, 10)})
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path)
+
+    with asdf.open(file_path, memmap=True) as af:
+        result = af["table"]
+        # The columns are views of their memory-mapped blocks
+        for name, block in zip(table.colnames, af._blocks.blocks):
+            assert_array_equal(result[name], table[name])
+            assert np.shares_memory(result[name], block.data)
+
+
+@pytest.mark.parametrize("compression", ["zlib", "bzp2", "lz4", None])
+@pytest.mark.parametrize("table_class", [Table, QTable])
+def test_table_parallel_decompression(tmp_path, compression, table_class):
+    if compression == "lz4":
+        pytest.importorskip("lz4")
+
+    file_path = tmp_path / "test.asdf"
+    table = table_class(meta={"name": "compressed"})
+    table["a"] = np.arange(1000, dtype=">i4")
+    table["b"] = np.linspace(0, 1, 1000) * u.deg
+    table["c"] = np.ones((1000, 3))
+    table["d"] = ["x"] * 1000
+    table["e"] = MaskedColumn(np.arange(1000), mask=np.arange(1000) % 2 == 0)
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path, all_array_compression=compression)
+
+    assert {header.compression for header in read_block_headers(file_path)} == {compression}
+
+    with config_context() as config:
+        config.decompression_threads = 4
+        with asdf.open(file_path) as af:
+            helpers.assert_table_equal(af["table"], table)
+
+
+def test_table_parallel_decompression_used(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    table = Table({"a": np.arange(1000), "b": np.linspace(0, 1, 1000)})
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path, all_array_compression="zlib")
+
+    reads = []
+
+    def record_read(*args):
+        reads.append(read := submit_read(*args))
+        return read
+
+    # The blocks are found from attributes private to asdf, fail rather
+    # than silently reading them through asdf if these change.
+    with config_context() as config, mk.patch("asdf_astropy.converters.table.table.submit_read", record_read):
+        config.decompression_threads = 4
+        with asdf.open(file_path) as af:
+            helpers.assert_table_equal(af["table"], table)
+
+    assert len(reads) == len(table.colnames)
+    assert all(read is not None for read in reads)
+
+
+def test_table_parallel_decompression_checksum(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    table = Table({"a": np.arange(1000)})
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path, all_array_compression="zlib")
+
+    # Change the last byte of the checksum of the block
+    (header,) = read_block_headers(file_path)
+    with open(file_path, "r+b") as fd:
+        fd.seek(header.offset + _BLOCK_PREFIX.size + _BLOCK_HEADER.size - 1)
+        fd.write(bytes([header.checksum[-1] ^ 0xFF]))
+
+    with config_context() as config, asdf.config_context() as asdf_config:
+        config.decompression_threads = 4
+        asdf_config.warn_on_failed_conversion = False
+        with (
+            pytest.raises(ValueError, match="does not match given checksum"),
+            asdf.open(file_path, validate_checksums=True) as af,
+        ):
+            af["table"]
+
+        # Checksums are only validated when asked for, as by asdf
+        with asdf.open(file_path) as af:
+            helpers.assert_table_equal(af["table"], table)
+
+
+class TableSum:
+    def __init__(self, table):
+        self.table = table
+        self.total = table["a"].sum()
+
+
+class TableSumConverter:
+    tags = ("asdf://example.com/tags/table_sum-1.0.0",)
+    types = (TableSum,)
+
+    def to_yaml_tree(self, obj, tag, ctx):
+        return {"table": obj.table}
+
+    def from_yaml_tree(self, node, tag, ctx):
+        return TableSum(node["table"])
+
+
+class TableSumExtension:
+    extension_uri = "asdf://example.com/extensions/table_sum-1.0.0"
+    tags = TableSumConverter.tags
+    converters = (TableSumConverter(),)
+
+
+def test_table_parallel_decompression_nested(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    table = Table({"a": np.arange(100_000)})
+
+    with asdf.config_context() as asdf_config:
+        asdf_config.add_extension(TableSumExtension())
+        with asdf.AsdfFile({"sum": TableSum(table)}) as af:
+            af.write_to(file_path, all_array_compression="zlib")
+
+        # Converters using the table see the decompressed data
+        with config_context() as config:
+            config.decompression_threads = 4
+            with asdf.open(file_path) as af:
+                assert af["sum"].total == table["a"].sum()
+                assert not hasattr(af["sum"].table["a"], "_asdf_astropy_future")
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_table_dask_backend(tmp_path, compression):
+    da = pytest.importorskip("dask.array")
+
+    file_path = tmp_path / "test.asdf"
+    table = Table(meta={"name": "dask"})
+    table["a"] = np.arange(1000, dtype=">i4")
+    table["b"] = np.ones((1000, 3))
+    table["b"].unit = u.m
+    table["b"].description = "ones"
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path, all_array_compression=compression)
+
+    with config_context() as config:
+        config.array_backend = "dask"
+        config.dask_chunks = 100
+        with asdf.open(file_path) as af:
+            result = af["table"]
+
+    # The dask arrays remain usable after the file is closed
+    for name in ("a", "b"):
+        assert isinstance(result[name], da.Array)
+        assert result[name].chunks[0] == (100,) * 10
+        assert_array_equal(result[name].compute(), table[name])
+    assert result["b"].info.unit == u.m
+    assert result["b"].info.description == "ones"
+    assert result["a"].sum().compute() == table["a"].sum()
+
+
+def test_table_write_dask(tmp_path):
+    da = pytest.importorskip("dask.array")
+
+    file_path = tmp_path / "test.asdf"
+    table = Table()
+    table["a"] = da.arange(1000, chunks=100)
+    table["a"].info.unit = u.s
+    table["b"] = np.arange(1000)
+    with asdf.AsdfFile({"table": table}) as af:
+        af.write_to(file_path)
+
+    with asdf.open(file_path) as af:
+        assert_array_equal(af["table"]["a"], np.arange(1000))
+        assert af["table"]["a"].unit == u.s
+        assert_array_equal(af["table"]["b"], np.arange(1000))
+
+
 # once asdf 2.14.x can be dropped and the minimum updated 2.15.0 this warning
 # filter can be removed
 @pytest.mark.filterwarnings(
@@ -29,6 +29,66 @@ _TAG_NAME_TO_MODEL_METHOD = {
 }
 
 
+# Chains of an associative operator nested deeper than this are written
+# as balanced trees.  asdf and the YAML parser recurse once per level of
+# nesting, so long left-deep chains built with ``a | b | c | ...`` would
+# otherwise exceed the recursion limit.
+_MAX_CHAIN_DEPTH = 64
+
+_ASSOCIATIVE_OPERATORS = ("|", "&")
+
+
+def _is_chain_link(model, op):
+    """
+    Check if a model is part of a chain of ``op`` that can be regrouped,
+    which requires that it does not carry properties of its own.
+    """
+    from astropy.modeling.core import CompoundModel
+
+    return (
+        isinstance(model, CompoundModel)
+        and model.op == op
+        and model.name is None
+        and getattr(model, "_user_inverse", None) is None
+        and getattr(model, "_user_bounding_box", None) is None
+    )
+
+
+def _chain_operands(model):
+    """
+    Find the operands, in order, of the chain of ``model.op`` rooted at
+    ``model`` and the nesting depth of the chain.
+    """
+    operands = []
+    depth = 0
+    stack = [(model.right, 1), (model.left, 1)]
+    while stack:
+        node, level = stack.pop()
+        if _is_chain_link(node, model.op):
+            stack.append((node.right, level + 1))
+            stack.append((node.left, level + 1))
+        else:
+            operands.append(node)
+            depth = max(depth, level)
+
+    return operands, depth
+
+
+def _balanced_chain(operands, op):
+    """
+    Combine operands with an associative operator into a balanced tree.
+    """
+    from astropy.modeling.core import CompoundModel
+
+    while len(operands) > 1:
+        combined = [CompoundModel(op, operands[i], operands[i + 1]) for i in range(0, len(operands) - 1, 2)]
+        if len(operands) % 2:
+            combined.append(operands[-1])
+        operands = combined
+
+    return operands[0]
+
+
 class CompoundConverter(TransformConverterBase):
     """
     ASDF serialization support for CompoundModel.
@@ -56,6 +116,17 @@ class CompoundConverter(TransformConverterBase):
         return next(t for t in tags if get_tag_name(t) == tag_name)
 
     def to_yaml_tree_transform(self, model, tag, ctx):
+        if model.op in _ASSOCIATIVE_OPERATORS:
+            operands, depth = _chain_operands(model)
+            if depth > _MAX_CHAIN_DEPTH:
+                middle = len(operands) // 2
+                return {
+                    "forward": [
+                        _balanced_chain(operands[:middle], model.op),
+                        _balanced_chain(operands[middle:], model.op),
+                    ],
+                }
+
         left = model.left
 
         right = (
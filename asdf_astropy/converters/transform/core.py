@@ -2,7 +2,9 @@ import abc
 
 from asdf.extension import Converter
 
+from asdf_astropy.config import get_config
 from asdf_astropy.converters.utils import import_type
+from asdf_astropy.lazy import load_lazy
 
 
 def parameter_to_value(param):
@@ -26,6 +28,44 @@ def parameter_to_value(param):
     return param.value
 
 
+def model_set_parameters_to_values(model):
+    """
+    Convert the parameters of a model set to Quantities or arrays that
+    are all views of a single array.
+
+    asdf writes views of the same array to a single binary block, so all
+    parameters of the model set are stored, and read back, together.
+
+    Parameters
+    ----------
+    model : astropy.modeling.Model
+        A model set, with ``len(model) > 1``.
+
+    Returns
+    -------
+    dict
+        Mapping of parameter name to `astropy.units.Quantity` or
+        `numpy.ndarray`.
+    """
+    import numpy as np
+    from astropy import units as u
+
+    packed = np.array(model.parameters)
+
+    values = {}
+    start = 0
+    for name in model.param_names:
+        param = getattr(model, name)
+        shape = np.shape(param.value)
+        size = int(np.prod(shape, dtype=np.int64))
+        value = packed[start : start + size].reshape(shape)
+        start += size
+
+        values[name] = value if param.unit is None else u.Quantity(value, param.unit, copy=False)
+
+    return values
+
+
 # One converter, UnitsMappingConverter, does not inherit
 # this class.  When adding features here consider also
 # updating UnitsMappingConverter.
@@ -147,6 +187,10 @@ class TransformConverterBase(Converter):
     def from_yaml_tree(self, node, tag, ctx):
         from astropy.modeling.core import CompoundModel
 
+        if get_config().lazy_quantity:
+            # Model parameters must be quantities, not proxies
+            node = load_lazy(node)
+
         model = self.from_yaml_tree_transform(node, tag, ctx)
 
         if "name" in node:
@@ -224,6 +268,18 @@ class SimpleTransformConverter(TransformConverterBase):
         return self._model_type
 
     def to_yaml_tree_transform(self, model, tag, ctx):
+        if len(model) > 1:
+            # The schemas only allow a number or a quantity for each
+            # parameter, so parameters without a unit cannot be arrays
+            if unitless := [name for name in model.param_names if getattr(model, name).unit is None]:
+                msg = f"{tag} does not support model sets with parameters without units: {', '.join(unitless)}"
+                raise TypeError(msg)
+
+            node = model_set_parameters_to_values(model)
+            node["n_models"] = len(model)
+            node["model_set_axis"] = model.model_set_axis
+            return node
+
         return {p: parameter_to_value(getattr(model, p)) for p in model.param_names}
 
     def from_yaml_tree_transform(self, node, tag, ctx):
@@ -232,4 +288,9 @@ class SimpleTransformConverter(TransformConverterBase):
         for param in model_type.param_names:
             if param in node:
                 model_kwargs[param] = node[param]
+
+        if "n_models" in node:
+            model_kwargs["n_models"] = node["n_models"]
+            model_kwargs["model_set_axis"] = node.get("model_set_axis", 0)
+
         return model_type(**model_kwargs)
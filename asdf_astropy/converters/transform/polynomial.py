@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 from packaging.version import parse as parse_version
 
@@ -6,6 +8,34 @@ from asdf_astropy.converters.helpers import parse_tag_version
 from .core import TransformConverterBase
 
 
+@functools.lru_cache
+def _coefficient_indices(param_names):
+    """
+    Row and column indices in the coefficient matrix of each of the
+    ``c{i}_{j}`` parameters of a 2D polynomial, in parameter order.
+    """
+    rows, cols = np.array([name[1:].split("_") for name in param_names], dtype=int).T
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
+
+def _pack_coefficients(model, shape):
+    """
+    Build the coefficient matrix of a 2D polynomial from its parameters.
+    """
+    coefficients = np.zeros(shape)
+    coefficients[_coefficient_indices(model.param_names)] = model.parameters
+    return coefficients
+
+
+def _unpack_coefficients(model, coefficients):
+    """
+    Set the parameters of a 2D polynomial from its coefficient matrix.
+    """
+    model.parameters = coefficients[_coefficient_indices(model.param_names)]
+
+
 class PolynomialConverter(TransformConverterBase):
     """
     ASDF support for serializing the 1D and 2D polynomial models.
@@ -28,13 +58,7 @@ class PolynomialConverter(TransformConverterBase):
         if isinstance(model, Polynomial1D):
             coefficients = np.array(model.parameters)
         elif isinstance(model, Polynomial2D):
-            degree = model.degree
-            coefficients = np.zeros((degree + 1, degree + 1))
-            for i in range(degree + 1):
-                for j in range(degree + 1):
-                    if i + j < degree + 1:
-                        name = "c" + str(i) + "_" + str(j)
-                        coefficients[i, j] = getattr(model, name).value
+            coefficients = _pack_coefficients(model, (model.degree + 1, model.degree + 1))
 
         node = {"coefficients": coefficients}
 
@@ -73,20 +97,14 @@ class PolynomialConverter(TransformConverterBase):
                 msg = "Coefficients must be an (n+1, n+1) matrix"
                 raise TypeError(msg)
 
-            coeffs = {}
-            for i in range(shape[0]):
-                for j in range(shape[0]):
-                    if i + j < degree + 1:
-                        name = "c" + str(i) + "_" + str(j)
-                        coeffs[name] = coefficients[i, j]
             model = Polynomial2D(
                 degree,
                 x_domain=x_domain,
                 y_domain=y_domain,
                 x_window=x_window,
                 y_window=y_window,
-                **coeffs,
             )
+            _unpack_coefficients(model, coefficients)
         else:
             msg = "astropy supports only 1D or 2D polynomial models"
             raise NotImplementedError(msg)
@@ -129,11 +147,7 @@ class OrthoPolynomialConverter(TransformConverterBase):
         if model.n_inputs == 1:
             coefficients = np.array(model.parameters)
         else:
-            coefficients = np.zeros((model.x_degree + 1, model.y_degree + 1))
-            for i in range(model.x_degree + 1):
-                for j in range(model.y_degree + 1):
-                    name = f"c{i}_{j}"
-                    coefficients[i, j] = getattr(model, name).value
+            coefficients = _pack_coefficients(model, (model.x_degree + 1, model.y_degree + 1))
 
         node = {"polynomial_type": poly_type, "coefficients": coefficients}
 
@@ -169,14 +183,9 @@ class OrthoPolynomialConverter(TransformConverterBase):
         elif n_dim == 2:  # noqa: PLR2004
             x_domain, y_domain = tuple(node.get("domain", (None, None)))
             x_window, y_window = tuple(node.get("window", (None, None)))
-            coeffs = {}
             shape = coefficients.shape
             x_degree = shape[0] - 1
             y_degree = shape[1] - 1
-            for i in range(x_degree + 1):
-                for j in range(y_degree + 1):
-                    name = f"c{i}_{j}"
-                    coeffs[name] = coefficients[i, j]
             model = model_type(
                 x_degree,
                 y_degree,
@@ -184,8 +193,8 @@ class OrthoPolynomialConverter(TransformConverterBase):
                 y_domain=y_domain,
                 x_window=x_window,
                 y_window=y_window,
-                **coeffs,
             )
+            _unpack_coefficients(model, coefficients)
         else:
             msg = "astropy supports only 1D or 2D polynomial models"
             raise NotImplementedError(msg)
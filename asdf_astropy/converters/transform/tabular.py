@@ -1,8 +1,59 @@
+import functools
+
+from asdf.tags.core.ndarray import NDArrayType
+
 from .core import TransformConverterBase
 
 __all__ = ["TabularConverter"]
 
 
+def _as_array(value):
+    # Points and lookup tables given as sequences would be written as
+    # YAML lists, convert them to arrays so they are stored in blocks
+    import numpy as np
+
+    return np.asanyarray(value)
+
+
+def _block_array(value):
+    # Make the array of an ndarray node, which for files opened with
+    # memmap=True is a view of the memory-mapped block.  Quantities are
+    # already views of their block.
+    if isinstance(value, NDArrayType):
+        return value._make_array()
+
+    return value
+
+
+# Classes for more than 2 dimensions are defined in asdf_astropy.tabular,
+# which is not imported here so that indexing the converters does not
+# import astropy.modeling.  asdf selects converters by the exact class of
+# an object, so only these classes, and not others created by
+# astropy.modeling.tabular.tabular_model, can be written.  Files with more
+# dimensions than these classes can still be read.
+_MAX_TABULAR_NDIM = 10
+
+
+@functools.lru_cache
+def _tabular_class(ndim):
+    # Look up or create the class for each number of dimensions once,
+    # rather than once per model read
+    from astropy.modeling import tabular
+
+    if ndim == 1:
+        return tabular.Tabular1D
+
+    if ndim == 2:  # noqa: PLR2004
+        return tabular.Tabular2D
+
+    if ndim <= _MAX_TABULAR_NDIM:
+        from asdf_astropy import tabular as tabular_nd
+
+        return getattr(tabular_nd, f"Tabular{ndim}D")
+
+    return tabular.tabular_model(ndim, name=f"Tabular{ndim}D")
+
+
 class TabularConverter(TransformConverterBase):
     """
     ASDF support for serializing tabular models.
@@ -12,45 +63,32 @@ class TabularConverter(TransformConverterBase):
     types = (
         "astropy.modeling.tabular.Tabular1D",
         "astropy.modeling.tabular.Tabular2D",
+        *(f"asdf_astropy.tabular.Tabular{ndim}D" for ndim in range(3, _MAX_TABULAR_NDIM + 1)),
     )
 
     def to_yaml_tree_transform(self, model, tag, ctx):
         node = {}
         if model.fill_value is not None:
             node["fill_value"] = model.fill_value
-        node["lookup_table"] = model.lookup_table
-        node["points"] = list(model.points)
+        node["lookup_table"] = _as_array(model.lookup_table)
+        node["points"] = [_as_array(p) for p in model.points]
         node["method"] = str(model.method)
         node["bounds_error"] = model.bounds_error
 
         return node
 
     def from_yaml_tree_transform(self, node, tag, ctx):
-        from astropy.modeling import tabular
-
-        lookup_table = node.pop("lookup_table")
-        dim = lookup_table.ndim
+        lookup_table = _block_array(node.pop("lookup_table"))
         fill_value = node.pop("fill_value", None)
-        if dim == 1:
-            points = (node["points"][0],)
-            model = tabular.Tabular1D(
-                points=points,
-                lookup_table=lookup_table,
-                method=node["method"],
-                bounds_error=node["bounds_error"],
-                fill_value=fill_value,
-            )
-        elif dim == 2:  # noqa: PLR2004
-            points = tuple(node["points"])
-            model = tabular.Tabular2D(
-                points=points,
-                lookup_table=lookup_table,
-                method=node["method"],
-                bounds_error=node["bounds_error"],
-                fill_value=fill_value,
-            )
-        else:
-            msg = "tabular models with ndim > 2 are not supported "
-            raise NotImplementedError(msg)
-
-        return model
+        points = tuple(_block_array(p) for p in node["points"])
+
+        # The lookup table is passed on without copying, so for files opened
+        # with memmap=True evaluating the model only reads the parts of the
+        # table around the evaluated points.
+        return _tabular_class(lookup_table.ndim)(
+            points=points[: lookup_table.ndim],
+            lookup_table=lookup_table,
+            method=node["method"],
+            bounds_error=node["bounds_error"],
+            fill_value=fill_value,
+        )
@@ -15,6 +15,8 @@ from astropy.modeling.bounding_box import CompoundBoundingBox, ModelBoundingBox
 from astropy.utils import minversion
 
 from asdf_astropy import integration
+from asdf_astropy._blocks import read_block_headers
+from asdf_astropy.converters.transform import OrthoPolynomialConverter, PolynomialConverter
 from asdf_astropy.testing import helpers
 
 
@@ -540,6 +542,165 @@ def test_compound_model(tmp_path, operator):
     assert result.op == model.op
 
 
+def test_compound_model_shared_submodels(tmp_path):
+    distortion = astropy_models.Polynomial2D(3)
+    distortion.parameters = np.arange(len(distortion.parameters))
+    mapping = astropy_models.Mapping((1, 0))
+    model = (mapping | distortion) & (mapping | distortion)
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["model"] = model
+        af.write_to(file_path)
+
+    # Repeated sub-models are written once and referenced with YAML aliases
+    contents = file_path.read_bytes()
+    assert contents.count(b"!transform/polynomial-") == 1
+    assert contents.count(b"!transform/remap_axes-") == 1
+
+    with asdf.open(file_path) as af:
+        result = af["model"]
+        assert result.left.right is result.right.right
+        assert result.left.left is result.right.left
+        helpers.assert_model_equal(result.left.right, distortion)
+        assert result(1, 2, 3, 4) == model(1, 2, 3, 4)
+
+
+@pytest.mark.parametrize("operator", ["__or__", "__and__"])
+def test_compound_model_long_chain(tmp_path, operator):
+    n_models = 100
+    model = astropy_models.Shift(0)
+    for i in range(1, n_models):
+        model = getattr(model, operator)(astropy_models.Shift(i))
+    model.name = "chain"
+
+    result = helpers.assert_model_roundtrip(model, tmp_path)
+    assert result.n_submodels == n_models
+
+    # The chain is written as a balanced tree
+    assert result.left.n_submodels == n_models // 2
+
+    # Evaluating the original left-deep chain recurses once per operator,
+    # so compare against the expected values instead
+    if operator == "__or__":
+        assert result(1) == 1 + sum(range(n_models))
+    else:
+        np.testing.assert_array_equal(result(*([1] * n_models)), np.arange(n_models) + 1)
+
+
+def test_compound_model_short_chain_structure(tmp_path):
+    models = [astropy_models.Shift(i) for i in range(10)]
+    model = models[0]
+    for other in models[1:]:
+        model |= other
+
+    result = helpers.assert_model_roundtrip(model, tmp_path)
+    helpers.assert_model_equal(result.right, models[-1])
+    helpers.assert_model_equal(result.left.right, models[-2])
+
+
+def test_model_set(tmp_path):
+    # The schemas of simple models only allow arrays as quantities
+    n_models = 1000
+    amplitude = np.arange(n_models) * u.Jy
+    mean = np.linspace(1, 2, n_models) * u.um
+    stddev = np.full(n_models, 0.1) * u.um
+    model = astropy_models.Gaussian1D(amplitude, mean, stddev, n_models=n_models)
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"model": model}) as af:
+        af.write_to(file_path)
+
+    # All of the parameters are stored in a single block
+    assert len(read_block_headers(file_path)) == 1
+
+    with asdf.open(file_path) as af:
+        result = af["model"]
+        assert len(result) == n_models
+        assert result.model_set_axis == model.model_set_axis
+        np.testing.assert_array_equal(result.parameters, model.parameters)
+        for name in model.param_names:
+            assert getattr(result, name).unit == getattr(model, name).unit
+        np.testing.assert_array_equal(result(1.5 * u.um), model(1.5 * u.um))
+
+
+def test_model_set_without_units(tmp_path):
+    model = astropy_models.Gaussian1D([1, 2] * u.Jy, [1, 2], [0.1, 0.2], n_models=2)
+
+    with pytest.raises(TypeError, match="does not support model sets with parameters without units: mean, stddev"):
+        asdf.AsdfFile({"model": model}).write_to(tmp_path / "test.asdf")
+
+
+def test_tabular_blocks(tmp_path):
+    points = list(range(1000))
+    lookup_table = [float(x) ** 2 for x in points]
+    model = astropy_models.Tabular1D(points=points, lookup_table=lookup_table)
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"model": model}) as af:
+        af.write_to(file_path, all_array_compression="zlib")
+
+    # Points and lookup table given as lists are written to binary blocks
+    assert len(read_block_headers(file_path)) == 2  # noqa: PLR2004
+
+    with asdf.open(file_path) as af:
+        result = af["model"]
+        np.testing.assert_array_equal(result.points[0], points)
+        np.testing.assert_array_equal(result.lookup_table, lookup_table)
+        assert result(10.5) == model(10.5)
+
+
+def test_tabular_memmap(tmp_path):
+    model = astropy_models.Tabular2D(
+        points=(np.arange(100.0), np.arange(200.0)),
+        lookup_table=np.arange(20000.0).reshape(100, 200),
+    )
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"model": model}) as af:
+        af.write_to(file_path)
+
+    with asdf.open(file_path, memmap=True) as af:
+        result = af["model"]
+        blocks = [block.data for block in af._blocks.blocks]
+        for value in (result.lookup_table, *result.points):
+            assert any(np.shares_memory(value, block) for block in blocks)
+        assert result(10.5, 20) == model(10.5, 20)
+
+
+@pytest.mark.parametrize("ndim", [3, 4])
+def test_tabular_nd(tmp_path, ndim):
+    from asdf_astropy import tabular
+
+    shape = (4, 5, 6, 7)[:ndim]
+    model_class = getattr(tabular, f"Tabular{ndim}D")
+    model = model_class(
+        points=tuple(np.arange(n, dtype=float) for n in shape),
+        lookup_table=np.arange(np.prod(shape), dtype=float).reshape(shape) * u.nm,
+        bounds_error=False,
+        fill_value=np.nan,
+    )
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"model": model}) as af:
+        af.write_to(file_path)
+
+    with asdf.open(file_path, memmap=True) as af:
+        result = af["model"]
+        assert type(result) is model_class
+        assert result.n_inputs == ndim
+        blocks = [block.data for block in af._blocks.blocks]
+        assert any(np.shares_memory(result.lookup_table, block) for block in blocks)
+
+        inputs = [1.5] * ndim
+        assert result(*inputs) == model(*inputs)
+        assert np.isnan(result(*([100] * ndim)))
+
+        # Reading the model again reuses the class
+        with asdf.open(file_path) as af2:
+            assert type(af2["model"]) is type(result)
+
+
 def test_fix_inputs(tmp_path):
     model = astropy_models.Gaussian2D(1, 2, 3, 4, 5)
     fixed_model = astropy_models.fix_inputs(model, {"x": 2.5})
@@ -644,6 +805,35 @@ def test_2d_polynomial_with_asdf_standard_version(tmp_path, standard_version, mo
     assert result.y_window == model.y_window
 
 
+@pytest.mark.parametrize(
+    ("model", "converter", "tag"),
+    [
+        (astropy_models.Polynomial2D(12), PolynomialConverter(), "tag:stsci.edu:asdf/transform/polynomial-1.2.0"),
+        (
+            astropy_models.Chebyshev2D(7, 4),
+            OrthoPolynomialConverter(),
+            "tag:stsci.edu:asdf/transform/ortho_polynomial-1.0.0",
+        ),
+        (
+            astropy_models.Legendre2D(3, 9),
+            OrthoPolynomialConverter(),
+            "tag:stsci.edu:asdf/transform/ortho_polynomial-1.0.0",
+        ),
+    ],
+)
+def test_2d_polynomial_coefficients(tmp_path, model, converter, tag):
+    model.parameters = np.arange(1, len(model.parameters) + 1)
+
+    coefficients = converter.to_yaml_tree_transform(model, tag, None)["coefficients"]
+
+    for name in model.param_names:
+        i, j = (int(index) for index in name[1:].split("_"))
+        assert coefficients[i, j] == getattr(model, name).value
+
+    result = helpers.assert_model_roundtrip(model, tmp_path)
+    np.testing.assert_array_equal(result.parameters, model.parameters)
+
+
 def test_deserialize_compound_user_inverse(tmp_path):
     """
     Confirm that we are able to correctly reconstruct a
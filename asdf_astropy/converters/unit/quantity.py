@@ -1,6 +1,8 @@
 from asdf.extension import Converter
 from asdf.tags.core.ndarray import NDArrayType
 
+from asdf_astropy.config import get_config
+
 
 class QuantityConverter(Converter):
     tags = ("tag:stsci.edu:asdf/unit/quantity-*",)
@@ -27,31 +29,77 @@ class QuantityConverter(Converter):
         return node
 
     def from_yaml_tree(self, node, tag, ctx):
-        # numpy 2.0 changed behavior for copy where an error is produced
-        # if False and a copy is required (previously there was no error)
-        # astropy 6.1 changed Quantity in a similar way
-        import numpy as np
-        from astropy.units import Quantity
-
-        copy = None if np.lib.NumpyVersion(np.__version__) >= "2.0.0b1" else False
-
         value = node["value"]
         dtype = node.get("datatype", None)
         if isinstance(value, NDArrayType):
+            # Subclasses of this converter build other types from the
+            # quantity, so only plain quantities can be deferred.
+            if tag.startswith("tag:stsci.edu:asdf/unit/quantity-") and get_config().lazy_quantity:
+                from asdf_astropy.lazy import LazyQuantity
+
+                return LazyQuantity(value, node["unit"])
+
             # TODO: Why doesn't NDArrayType work?  This needs some research
             # and documentation.
             value = value._make_array()
             dtype = value.dtype
 
-        if isinstance(value, np.ma.MaskedArray):
-            from astropy.utils import minversion
-            from astropy.utils.masked import Masked
+        return make_quantity(value, node["unit"], dtype)
+
+
+def copy_if_needed():
+    """
+    Value of the ``copy`` argument of numpy and astropy constructors
+    that only copies the data when required.
+
+    Returns
+    -------
+    bool or None
+    """
+    # numpy 2.0 changed behavior for copy where an error is produced
+    # if False and a copy is required (previously there was no error)
+    # astropy 6.1 changed Quantity in a similar way
+    import numpy as np
+
+    return None if np.lib.NumpyVersion(np.__version__) >= "2.0.0b1" else False
+
+
+def make_quantity(value, unit, dtype=None):
+    """
+    Build a quantity from the value of a quantity node.
+
+    Parameters
+    ----------
+    value : numpy.ndarray or number
+        The value, array values are not copied.
+    unit : astropy.units.UnitBase
+    dtype : str or numpy.dtype, optional
+        The datatype of the quantity.
+
+    Returns
+    -------
+    astropy.units.Quantity
+    """
+    import numpy as np
+    from astropy.units import Quantity
+
+    copy = copy_if_needed()
+
+    if isinstance(value, np.ma.MaskedArray):
+        from astropy.utils import minversion
+        from astropy.utils.masked import Masked
+
+        if not minversion("astropy", "7.1.dev"):  # ASTROPY_GE_7_1
+            msg = "MaskedQuantity support requires astropy 7.1 or later"
+            raise NotImplementedError(msg)
+        return Masked(Quantity)(value, unit=unit, copy=copy, dtype=dtype)
 
-            if not minversion("astropy", "7.1.dev"):  # ASTROPY_GE_7_1
-                msg = "MaskedQuantity support requires astropy 7.1 or later"
-                raise NotImplementedError(msg)
-            class_ = Masked(Quantity)
-        else:
-            class_ = Quantity
+    if isinstance(value, np.ndarray):
+        # View the array rather than passing it to the constructor,
+        # which guarantees quantities share memory with the block
+        # data (including memory-mapped blocks).
+        quantity = value.view(Quantity)
+        quantity._set_unit(unit)
+        return quantity
 
-        return class_(value, unit=node["unit"], copy=copy, dtype=dtype)
+    return Quantity(value, unit=unit, copy=copy, dtype=dtype)
@@ -113,6 +113,26 @@ def test_memmap(tmp_path):
         assert (af.tree["quantity"] == new_quantity).all()
 
 
+def test_memmap_shares_memory(tmp_path):
+    """
+    Test that quantities read with memmap=True are views of the block data.
+    """
+    file_path = tmp_path / "test.asdf"
+    quantity = Quantity(np.arange(100, dtype=np.int32).reshape(5, 20), units.km, dtype=np.int32)
+
+    with asdf.AsdfFile() as af:
+        af["quantity"] = quantity
+        af.write_to(file_path)
+
+    with asdf.open(file_path, memmap=True) as af:
+        value = af.tree["quantity"]
+        assert value.dtype == quantity.dtype
+        assert_array_equal(value, quantity)
+
+        block_data = af._blocks.blocks[0].data
+        assert np.shares_memory(value, block_data)
+
+
 def test_no_memmap(tmp_path):
     """
     Test that turning off memmap (memmap=False) works as expected for quantities
@@ -66,3 +66,53 @@ unit: !unit/unit-1.0.0 "2.1798721  10-18kg m2 s-2"
     buff = helpers.yaml_to_asdf(yaml)
     with asdf.open(buff) as af:
         assert af["unit"].is_equivalent(units.Ry)
+
+
+def test_read_cached():
+    yaml = """
+units:
+  - !unit/unit-1.0.0 "m s-1"
+  - !unit/unit-1.0.0 "m s-1"
+  - !<tag:astropy.org:astropy/units/unit-1.0.0> "m / s"
+    """
+    buff = helpers.yaml_to_asdf(yaml)
+    with asdf.open(buff) as af:
+        a, b, c = af["units"]
+        assert a is b
+        assert a == c == units.m / units.s
+
+
+def test_read_cached_enabled_units():
+    yaml = """
+unit: !<tag:astropy.org:astropy/units/unit-1.0.0> "asdfastropyunit"
+    """
+    with asdf.open(helpers.yaml_to_asdf(yaml)) as af:
+        assert isinstance(af["unit"], units.UnrecognizedUnit)
+
+    custom_unit = units.def_unit("asdfastropyunit")
+
+    # The unit parsed before the custom unit was enabled is not reused
+    with units.add_enabled_units([custom_unit]), asdf.open(helpers.yaml_to_asdf(yaml)) as af:
+        assert af["unit"] == custom_unit
+
+
+@pytest.mark.parametrize(("unit", "tag"), [(units.m / units.s, "stsci.edu"), (create_non_vounits()[0], "astropy.org")])
+def test_write_cached(unit, tag, tmp_path):
+    from asdf_astropy.converters.unit.unit import _format_unit
+
+    _format_unit.cache_clear()
+
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["units"] = [unit] * 3
+        af.write_to(file_path)
+
+    # each distinct unit and format is only formatted once
+    info = _format_unit.cache_info()
+    assert info.misses == (1 if tag == "stsci.edu" else 2)
+
+    with file_path.open() as f:
+        assert f"tag:{tag}:" in f.read()
+
+    with asdf.open(file_path) as af:
+        assert af["units"] == [unit] * 3
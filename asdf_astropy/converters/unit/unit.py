@@ -1,7 +1,64 @@
+import functools
 import warnings
 
 from asdf.extension import Converter
 
+# Maximum number of distinct unit strings kept by the parsed unit cache
+UNIT_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _parse_unit(string, format_, registry):
+    """
+    Parse a unit string, caching the result.
+
+    The unit registry is part of the cache key so that enabling new
+    units does not return stale results.
+    """
+    from astropy.units import Unit, UnitsWarning
+
+    kwargs = {"parse_strict": "silent"}
+    if format_ is not None:
+        kwargs["format"] = format_
+
+    with warnings.catch_warnings():
+        # astropy emits "deprecated" warnings when there is no plan
+        # to remove these units so we just ignore them here
+        warnings.simplefilter("ignore", category=UnitsWarning)
+
+        return Unit(string, **kwargs)
+
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _format_unit(unit, format_):
+    """
+    Format a unit, caching the result.
+
+    Returns `None` if the unit cannot be represented in the format.
+    """
+    from astropy.units import UnitsError, UnitsWarning
+
+    if format_ is None:
+        return unit.to_string()
+
+    with warnings.catch_warnings():
+        # astropy emits "deprecated" warnings when there is no plan
+        # to remove these units so we just ignore them here
+        warnings.simplefilter("ignore", category=UnitsWarning)
+
+        try:
+            return unit.to_string(format=format_)
+        except (UnitsError, ValueError):
+            return None
+
+
+def _unit_string(unit, format_):
+    try:
+        return _format_unit(unit, format_)
+    except TypeError:
+        # unhashable unit, format it without the cache
+        return _format_unit.__wrapped__(unit, format_)
+
 
 class UnitConverter(Converter):
     tags = (
@@ -21,42 +78,31 @@ class UnitConverter(Converter):
     )
 
     def select_tag(self, obj, tags, ctx):
-        from astropy.units import UnitsError, UnitsWarning
+        # The formatted unit is cached so that to_yaml_tree does not
+        # format the unit a second time.
+        if _unit_string(obj, "vounit") is None:
+            return next(t for t in tags if "astropy.org" in t)
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=UnitsWarning)
-
-            try:
-                obj.to_string(format="vounit")
-            except (UnitsError, ValueError):
-                return next(t for t in tags if "astropy.org" in t)
-
-            return next(t for t in tags if "stsci.edu" in t)
+        return next(t for t in tags if "stsci.edu" in t)
 
     def to_yaml_tree(self, obj, tag, ctx):
         from astropy.units import UnitsWarning
 
         if "stsci.edu" in tag:
+            if (string := _unit_string(obj, "vounit")) is not None:
+                return string
+
+            # Not representable as a vounit, let astropy raise the error
             with warnings.catch_warnings():
-                # astropy emits "deprecated" warnings when there is no plan
-                # to remove these units so we just ignore them here
                 warnings.simplefilter("ignore", category=UnitsWarning)
                 return obj.to_string(format="vounit")
 
-        return obj.to_string()
+        return _unit_string(obj, None)
 
     def from_yaml_tree(self, node, tag, ctx):
-        from astropy.units import Unit
-
-        kwargs = {"parse_strict": "silent"}
-        if "stsci.edu" in tag:
-            kwargs["format"] = "vounit"
-
-        from astropy.units import UnitsWarning
-
-        with warnings.catch_warnings():
-            # astropy emits "deprecated" warnings when there is no plan
-            # to remove these units so we just ignore them here
-            warnings.simplefilter("ignore", category=UnitsWarning)
+        from astropy.units import get_current_unit_registry
 
-            return Unit(node, **kwargs)
+        # Files often repeat the same few units, so parsed units are
+        # cached (units are immutable and safe to share).
+        format_ = "vounit" if "stsci.edu" in tag else None
+        return _parse_unit(node, format_, get_current_unit_registry())
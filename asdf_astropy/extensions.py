@@ -37,6 +37,7 @@ from .converters.unit.unit import UnitConverter
 from .converters.wcs.highlevelwrapper import HighLevelWCSWrapperConverter
 from .converters.wcs.slicedwcs import SlicedWCSConverter
 from .converters.wcs.wcs import WCSConverter
+from .profiling import _profile_from_environment
 
 __all__ = [
     "ASTROPY_CONVERTERS",
@@ -662,3 +663,8 @@ EMPTY_EXTENSIONS = [
         "asdf://astropy.org/core/extensions/core-1.0.0",
     ]
 ]
+
+
+# Profile all converters if requested by the ASDF_ASTROPY_PROFILE
+# environment variable, see asdf_astropy.profiling
+_profile_from_environment()
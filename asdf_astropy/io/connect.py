@@ -1,12 +1,18 @@
 # This file connects ASDF to the astropy.table.Table class
 import contextlib
+import numbers
+import tempfile
+from pathlib import Path
 
 import asdf
+import numpy as np
 from astropy.io import registry as io_registry
 from astropy.table import Table
 
+__all__ = ["TableStreamWriter", "iter_table", "read_table", "set_table_compression", "write_table"]
 
-def read_table(filename, data_key=None, find_table=None, **kwargs):
+
+def read_table(filename, data_key=None, find_table=None, columns=None, rows=None, **kwargs):
     """
     Read a `~astropy.table.Table` object from an ASDF file
 
@@ -19,7 +25,7 @@ def read_table(filename, data_key=None, find_table=None, **kwargs):
 
     Parameters
     ----------
-    filename : str or :class:`py.path:local`
+    filename : str or `pathlib.Path`
         Name of the file to be read
     data_key : str
         Optional top-level key to use for finding the Table in the tree. If not
@@ -30,6 +36,14 @@ def read_table(filename, data_key=None, find_table=None, **kwargs):
         function takes a single parameter, which is a dictionary representing
         the top of the ASDF tree. The function must return a
         `~astropy.table.Table` instance.
+    columns : list of str
+        Optional names of the columns to read. If not provided, all columns
+        are read. Unless ``find_table`` is used, the other columns are not
+        converted, so their blocks are never read or decompressed.
+    rows : slice, int or array-like
+        Optional selection of the rows to read. This can be anything that
+        is accepted as an index of a column: a `slice`, an integer, an array
+        of integers or a boolean mask. If not provided, all rows are read.
 
     Returns
     -------
@@ -40,14 +54,138 @@ def read_table(filename, data_key=None, find_table=None, **kwargs):
         msg = "Options 'data_key' and 'find_table' are not compatible"
         raise ValueError(msg)
 
+    if columns is not None or rows is not None:
+        # Memory map the blocks so that only the data of the selected
+        # columns and rows is read from disk.
+        kwargs.setdefault("memmap", True)
+
+    if columns is not None and not find_table:
+        kwargs.setdefault("lazy_tree", True)
+
     with asdf.open(filename, **kwargs) as af:
-        if find_table:
-            return find_table(af.tree)
+        if columns is not None and not find_table:
+            _select_tagged_columns(af, data_key or "data", columns)
+
+        table = find_table(af.tree) if find_table else af[data_key or "data"]
 
-        return af[data_key or "data"]
+        if columns is None and rows is None:
+            return table
 
+        return _select_table(table, columns, rows)
 
-def write_table(table, filename, data_key=None, make_tree=None, **kwargs):
+
+def iter_table(filename, chunk_size=100_000, data_key=None, find_table=None, columns=None, **kwargs):
+    """
+    Iterate over a `~astropy.table.Table` in an ASDF file in chunks of rows.
+
+    The file is opened once and, unless ``memmap=False`` is passed, memory
+    mapped so that each chunk is a view of the stored column blocks and
+    only the rows of the current chunk are read from disk. Column units,
+    descriptions and meta are kept, and mixin columns such as
+    `~astropy.coordinates.SkyCoord` and `~astropy.time.Time` are sliced
+    along with the other columns.
+
+    The table is located in the same way as by `read_table`.
+
+    Parameters
+    ----------
+    filename : str or `pathlib.Path`
+        Name of the file to be read
+    chunk_size : int
+        Number of rows in each chunk. The last chunk may be shorter.
+    data_key : str
+        Optional top-level key to use for finding the Table in the tree. See
+        `read_table`.
+    find_table : function
+        Optional function to be used for locating the Table in the tree. See
+        `read_table`.
+    columns : list of str
+        Optional names of the columns to read. If not provided, all columns
+        are read. As with `read_table`, the other columns are not converted
+        unless ``find_table`` is used.
+
+    Yields
+    ------
+    table : `~astropy.table.Table`
+        `~astropy.table.Table` instance containing the next chunk of rows
+    """
+    if data_key and find_table:
+        msg = "Options 'data_key' and 'find_table' are not compatible"
+        raise ValueError(msg)
+
+    if chunk_size < 1:
+        msg = "chunk_size must be a positive integer"
+        raise ValueError(msg)
+
+    kwargs.setdefault("memmap", True)
+    if columns is not None and not find_table:
+        kwargs.setdefault("lazy_tree", True)
+
+    with asdf.open(filename, **kwargs) as af:
+        if columns is not None and not find_table:
+            _select_tagged_columns(af, data_key or "data", columns)
+
+        table = find_table(af.tree) if find_table else af[data_key or "data"]
+
+        if columns is not None:
+            table = _select_table(table, columns, None, copy=False)
+
+        for start in range(0, len(table), chunk_size):
+            yield table[start : start + chunk_size]
+
+
+def _select_tagged_columns(asdf_file, key, columns):
+    """
+    Drop the columns that are not selected from the unconverted node of
+    a table in a file opened with ``lazy_tree=True``, so that they are
+    never converted.
+
+    The node is replaced rather than modified, in case other parts of the
+    tree refer to the same table.  Nothing is done if the file was not
+    opened with a lazy tree or the node is not an astropy table.
+    """
+    from asdf.tagged import TaggedDict
+
+    tagged_tree = getattr(getattr(asdf_file.tree, "data", None), "tagged", None)
+    if not isinstance(tagged_tree, dict):
+        return
+
+    node = tagged_tree.get(key)
+    if not isinstance(node, TaggedDict) or not node._tag.startswith("tag:astropy.org:astropy/table/table-"):
+        return
+
+    selected = [index for index, name in enumerate(node["colnames"]) if name in columns]
+    tagged_tree[key] = TaggedDict(
+        {
+            **node,
+            "columns": [node["columns"][index] for index in selected],
+            "colnames": [node["colnames"][index] for index in selected],
+        },
+        node._tag,
+    )
+
+
+def _select_table(table, columns, rows, *, copy=True):
+    """
+    Build a new table of the same class from the selected
+    columns and rows of a table.
+    """
+    names = table.colnames if columns is None else list(columns)
+
+    missing = [name for name in names if name not in table.colnames]
+    if missing:
+        msg = f"Column(s) {', '.join(missing)} not found in table"
+        raise ValueError(msg)
+
+    if isinstance(rows, numbers.Integral):
+        rows = [rows]
+
+    selected = [table[name] if rows is None else table[name][rows] for name in names]
+
+    return table.__class__(selected, names=names, meta=table.meta, copy=copy)
+
+
+def write_table(table, filename, data_key=None, make_tree=None, compression=None, **kwargs):
     """
     Write a `~astropy.table.Table` object to an ASDF file.
 
@@ -62,7 +200,7 @@ def write_table(table, filename, data_key=None, make_tree=None, **kwargs):
     ----------
     table : `~astropy.table.Table`
         `~astropy.table.Table` instance to be written
-    filename : str or :class:`py.path:local`
+    filename : str or `pathlib.Path`
         Name of the new ASDF file to be created
     data_key : str
         Optional top-level key in the ASDF tree to use when writing the Table.
@@ -73,17 +211,301 @@ def write_table(table, filename, data_key=None, make_tree=None, **kwargs):
         takes a single parameter, which is the `~astropy.table.Table` instance
         to be written. The function must return a `dict` representing the ASDF
         tree to be created.
+    compression : dict or str
+        Optional compression of the column blocks, see
+        `set_table_compression`. Use of this parameter is not compatible
+        with ``all_array_compression``.
     """
     if data_key and make_tree:
         msg = "Options 'data_key' and 'make_tree' are not compatible"
         raise ValueError(msg)
 
+    if compression is not None and "all_array_compression" in kwargs:
+        msg = "Options 'compression' and 'all_array_compression' are not compatible"
+        raise ValueError(msg)
+
     tree = make_tree(table) if make_tree else {data_key or "data": table}
 
     with asdf.AsdfFile(tree) as af:
+        if compression is not None:
+            set_table_compression(af, table, compression)
         af.write_to(filename, **kwargs)
 
 
+def set_table_compression(asdf_file, table, compression):
+    """
+    Set the compression of the column blocks of a `~astropy.table.Table`.
+
+    Parameters
+    ----------
+    asdf_file : `asdf.AsdfFile`
+        The file that the table will be written with.
+    table : `~astropy.table.Table`
+        `~astropy.table.Table` instance to be written
+    compression : dict or str
+        Either a `dict` mapping column names to the name of a compression
+        codec (``"zlib"``, ``"bzp2"``, ``"lz4"`` or any codec provided by an
+        asdf extension) or `None` to not compress the column, or ``"auto"``
+        to choose a codec for each column by compressing a sample of its
+        data. Columns that are not included keep the default compression of
+        the file.
+
+        With ``"auto"`` the options are tried from the fastest to the
+        slowest to decompress: no compression, ``"lz4"`` (if installed) and
+        ``"zlib"``. A slower option is only chosen if it shrinks the sample
+        by at least 10% compared to the faster one. ``"bzp2"`` is never
+        chosen, as it decompresses several times slower than ``"zlib"`` and
+        ``"lz4"``, but it can be set explicitly for columns where the
+        smallest file matters more.
+    """
+    from asdf_astropy._blocks import choose_compression
+
+    if compression == "auto":
+        arrays = {name: _column_array(table[name]) for name in table.colnames}
+        compression = {name: choose_compression(array) for name, array in arrays.items() if array is not None}
+    else:
+        missing = [name for name in compression if name not in table.colnames]
+        if missing:
+            msg = f"Column(s) {', '.join(missing)} not found in table"
+            raise ValueError(msg)
+
+    for name, codec in compression.items():
+        array = _column_array(table[name])
+        if array is None:
+            msg = f"Cannot set the compression of column '{name}' of type {type(table[name]).__name__}"
+            raise TypeError(msg)
+        asdf_file.set_array_compression(array, codec)
+
+
+def _column_array(column):
+    """
+    Return the array that is stored in the block of a column, or `None`
+    if the column is not stored in a single block.
+    """
+    from astropy.table import Column
+    from astropy.units import Quantity
+
+    if isinstance(column, Column):
+        return np.ma.getdata(column.data)
+
+    if isinstance(column, Quantity) and not hasattr(column, "mask"):
+        return column.value
+
+    return None
+
+
+class TableStreamWriter:
+    """
+    Write a `~astropy.table.Table` to an ASDF file in chunks of rows.
+
+    Chunks passed to `~TableStreamWriter.append` are spooled to one raw file
+    per column in a temporary directory. When the writer is closed the table
+    is assembled from memory-mapped views of those files and written with
+    `write_table`, so the full table never has to be held in memory.
+
+    Only `~astropy.table.Column`, `~astropy.table.MaskedColumn` and
+    `~astropy.units.Quantity` columns are supported.
+
+    Parameters
+    ----------
+    filename : str or `pathlib.Path`
+        Name of the new ASDF file to be created
+    data_key : str
+        Optional top-level key in the ASDF tree to use when writing the Table.
+        See `write_table`.
+    make_tree : function
+        Optional function to be used for creating the ASDF tree. See
+        `write_table`.
+    tmpdir : str
+        Optional directory in which the column data is spooled. If not
+        provided, the default temporary directory is used.
+    **kwargs
+        Passed to `write_table` when the writer is closed.
+
+    Examples
+    --------
+    >>> with TableStreamWriter("catalog.asdf") as writer:  # doctest: +SKIP
+    ...     for chunk in chunks:
+    ...         writer.append(chunk)
+    """
+
+    def __init__(self, filename, data_key=None, make_tree=None, tmpdir=None, **kwargs):
+        if data_key and make_tree:
+            msg = "Options 'data_key' and 'make_tree' are not compatible"
+            raise ValueError(msg)
+
+        self._filename = filename
+        self._write_kwargs = {"data_key": data_key, "make_tree": make_tree, **kwargs}
+        self._tmpdir = tempfile.TemporaryDirectory(dir=tmpdir, ignore_cleanup_errors=True)
+        self._table_class = None
+        self._meta = None
+        self._columns = None
+        self._files = {}
+        self._mask_files = {}
+        self._nrows = 0
+        self._closed = False
+
+    @property
+    def nrows(self):
+        """
+        Number of rows appended so far.
+        """
+        return self._nrows
+
+    def append(self, table):
+        """
+        Append the rows of a table to the file.
+
+        The first table appended defines the column names, dtypes, units,
+        descriptions and meta of the written table. Later tables must have
+        the same columns, with dtypes that can be safely cast to the dtypes
+        of the first table. Quantity columns are converted to the units of
+        the first table, other columns must have the same units.
+
+        Parameters
+        ----------
+        table : `~astropy.table.Table`
+            Chunk of rows to append.
+        """
+        if self._closed:
+            msg = "Cannot append to a closed TableStreamWriter"
+            raise ValueError(msg)
+
+        if self._columns is None:
+            self._start(table)
+        elif table.colnames != list(self._columns):
+            msg = f"Column names {table.colnames} do not match {list(self._columns)}"
+            raise ValueError(msg)
+
+        # Check every column before writing so that a bad chunk
+        # does not leave the spooled columns with different lengths.
+        chunk = {}
+        for name, info in self._columns.items():
+            data = _column_data(table[name], info["unit"])
+            if not np.can_cast(data.dtype, info["dtype"], casting="safe"):
+                msg = f"Cannot safely cast column '{name}' from {data.dtype} to {info['dtype']}"
+                raise TypeError(msg)
+            if data.shape[1:] != info["shape"]:
+                msg = f"Column '{name}' has row shape {data.shape[1:]}, expected {info['shape']}"
+                raise ValueError(msg)
+            if not info["masked"] and np.ma.is_masked(data):
+                msg = f"Column '{name}' has masked values but was not masked in the first chunk"
+                raise ValueError(msg)
+            chunk[name] = data
+
+        for name, data in chunk.items():
+            info = self._columns[name]
+            np.ascontiguousarray(np.ma.getdata(data), dtype=info["dtype"]).tofile(self._files[name])
+            if info["masked"]:
+                np.ascontiguousarray(np.ma.getmaskarray(data)).tofile(self._mask_files[name])
+
+        self._nrows += len(table)
+
+    def close(self):
+        """
+        Write the ASDF file and remove the spooled column data.
+        """
+        if self._closed:
+            return
+
+        try:
+            self._close_files()
+            if self._columns is not None:
+                write_table(self._build_table(), self._filename, **self._write_kwargs)
+        finally:
+            self._cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't write a partial table if the caller failed
+            self._cleanup()
+
+    def _close_files(self):
+        for fd in [*self._files.values(), *self._mask_files.values()]:
+            fd.close()
+
+    def _cleanup(self):
+        self._closed = True
+        self._close_files()
+        self._tmpdir.cleanup()
+
+    def _start(self, table):
+        self._table_class = table.__class__
+        self._meta = table.meta
+        self._columns = {}
+
+        for index, name in enumerate(table.colnames):
+            column = table[name]
+            data = _column_data(column, getattr(column, "unit", None))
+            masked = isinstance(data, np.ma.MaskedArray)
+            self._columns[name] = {
+                "dtype": data.dtype,
+                "shape": data.shape[1:],
+                "masked": masked,
+                "unit": column.unit,
+                "description": column.info.description,
+                "meta": column.info.meta,
+            }
+
+            path = Path(self._tmpdir.name) / str(index)
+            self._files[name] = open(path, "wb")
+            if masked:
+                self._mask_files[name] = open(path.with_suffix(".mask"), "wb")
+
+    def _build_table(self):
+        from astropy.table import Column, MaskedColumn
+
+        columns = []
+        for name, info in self._columns.items():
+            data = self._load(self._files[name], info["dtype"], info["shape"])
+            kwargs = {
+                "name": name,
+                "unit": info["unit"],
+                "description": info["description"],
+                "meta": info["meta"],
+                "copy": False,
+            }
+            if info["masked"]:
+                mask = self._load(self._mask_files[name], np.dtype(bool), info["shape"])
+                columns.append(MaskedColumn(data=data, mask=mask, **kwargs))
+            else:
+                columns.append(Column(data=data, **kwargs))
+
+        return self._table_class(columns, meta=self._meta, copy=False)
+
+    def _load(self, fd, dtype, shape):
+        shape = (self._nrows, *shape)
+        if self._nrows == 0:
+            return np.empty(shape, dtype=dtype)
+
+        return np.memmap(fd.name, dtype=dtype, mode="r", shape=shape)
+
+
+def _column_data(column, unit):
+    """
+    Return the data of a column in ``unit`` as a (possibly masked) array.
+    """
+    from astropy.table import Column
+    from astropy.units import Quantity, dimensionless_unscaled
+
+    if isinstance(column, Column):
+        if column.unit != unit:
+            msg = f"Column '{column.info.name}' has unit {column.unit}, expected {unit}"
+            raise ValueError(msg)
+        return column.data
+
+    if isinstance(column, Quantity) and not hasattr(column, "mask"):
+        return column.to_value(dimensionless_unscaled if unit is None else unit)
+
+    msg = f"Columns of type {type(column).__name__} cannot be streamed"
+    raise TypeError(msg)
+
+
 def asdf_identify(origin, filepath, fileobj, *args, **kwargs):
     return filepath is not None and filepath.endswith(".asdf")
 
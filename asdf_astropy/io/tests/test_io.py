@@ -1,10 +1,18 @@
+import tracemalloc
 import unittest.mock as mk
 
 import asdf
+import astropy.units as u
+import numpy as np
 import pytest
-from astropy.table import Table
+from astropy.coordinates import SkyCoord
+from astropy.table import MaskedColumn, QTable, Table, vstack
+from astropy.time import Time
 
-from asdf_astropy.io.connect import read_table, write_table
+from asdf_astropy._blocks import choose_compression, read_block_headers
+from asdf_astropy.converters.time import TimeConverter
+from asdf_astropy.io.connect import TableStreamWriter, iter_table, read_table, set_table_compression, write_table
+from asdf_astropy.testing import helpers
 
 
 def make_table():
@@ -82,6 +90,177 @@ def test_table_io_custom_tree(tmp_path):
     assert all(new_t == table)
 
 
+@pytest.mark.parametrize(
+    ("rows", "expected"),
+    [
+        (None, [0, 1, 2]),
+        (slice(1, 3), [1, 2]),
+        (1, [1]),
+        ([2, 0], [2, 0]),
+        (np.array([True, False, True]), [0, 2]),
+    ],
+)
+@pytest.mark.parametrize("columns", [None, ["c", "a"]])
+def test_table_io_select(tmp_path, columns, rows, expected):
+    tmp_file = tmp_path / "table.asdf"
+
+    table = make_table()
+    table.write(tmp_file)
+
+    new_t = Table.read(tmp_file, columns=columns, rows=rows)
+
+    assert new_t.colnames == (columns or table.colnames)
+    assert new_t.meta == table.meta
+    for name in new_t.colnames:
+        assert list(new_t[name]) == [table[name][i] for i in expected]
+
+
+def test_table_io_select_unconverted(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    table = make_table()
+    table["t"] = Time(55000 + np.arange(3), format="mjd")
+    write_table(table, tmp_file)
+
+    # The columns that are not selected are never converted
+    with mk.patch.object(TimeConverter, "from_yaml_tree", side_effect=AssertionError("converted")):
+        new_t = Table.read(tmp_file, columns=["c", "a"])
+        chunks = list(iter_table(tmp_file, chunk_size=2, columns=["a"]))
+
+    assert new_t.colnames == ["c", "a"]
+    assert list(new_t["a"]) == list(table["a"])
+    assert [chunk["a"].tolist() for chunk in chunks] == [[1, 4], [5]]
+
+
+def test_table_io_select_missing_column(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    make_table().write(tmp_file)
+
+    with pytest.raises(ValueError, match=r"Column\(s\) d not found in table"):
+        Table.read(tmp_file, columns=["a", "d"])
+
+
+@pytest.mark.parametrize("columns", [None, ["d", "a"]])
+def test_iter_table(tmp_path, columns):
+    tmp_file = tmp_path / "table.asdf"
+
+    table = QTable(meta={"name": "mixins"})
+    table["a"] = np.arange(10) * u.m
+    table["b"] = Time(55000 + np.arange(10), format="mjd")
+    table["c"] = SkyCoord(np.arange(10), np.arange(10), unit="deg")
+    table["d"] = np.arange(10)
+    table["d"].info.description = "index"
+    write_table(table, tmp_file)
+
+    chunks = list(iter_table(tmp_file, chunk_size=4, columns=columns))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    for start, chunk in zip(range(0, 10, 4), chunks):
+        expected = table[start : start + 4]
+        assert chunk.colnames == (columns or table.colnames)
+        assert chunk.meta == table.meta
+        assert chunk["d"].tolist() == expected["d"].tolist()
+        assert chunk["d"].info.description == "index"
+        assert chunk["a"].unit == u.m
+        assert (chunk["a"] == expected["a"]).all()
+        if columns is None:
+            helpers.assert_time_equal(chunk["b"], expected["b"])
+            helpers.assert_sky_coord_equal(chunk["c"], expected["c"])
+
+
+def test_iter_table_error(tmp_path):
+    file_name = tmp_path / "table.asdf"
+
+    with pytest.raises(ValueError, match="Options 'data_key' and 'find_table' are not compatible"):
+        next(iter_table(file_name, data_key=mk.MagicMock(), find_table=mk.MagicMock()))
+
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+        next(iter_table(file_name, chunk_size=0))
+
+
+def test_table_io_compression(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    table = QTable()
+    table["a"] = np.zeros(1000, dtype=int)
+    table["b"] = np.zeros(1000) * u.m
+    table["c"] = np.zeros(1000)
+    write_table(table, tmp_file, compression={"a": "zlib", "b": "bzp2", "c": None})
+
+    assert sorted(header.compression or "" for header in read_block_headers(tmp_file)) == ["", "bzp2", "zlib"]
+    helpers.assert_table_equal(read_table(tmp_file), table)
+
+
+def test_table_io_compression_auto(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    rng = np.random.default_rng(42)
+    table = Table()
+    table["id"] = rng.integers(0, 2**63, 10_000)
+    table["flag"] = np.zeros(10_000, dtype=int)
+    table["t"] = Time(55000 + np.arange(10_000), format="mjd")
+    table.write(tmp_file, compression="auto")
+
+    compressions = [header.compression for header in read_block_headers(tmp_file)]
+    assert compressions[0] is None
+    assert compressions[1] is not None
+
+    new_t = Table.read(tmp_file)
+    assert (new_t["id"] == table["id"]).all()
+    assert (new_t["flag"] == table["flag"]).all()
+
+
+@pytest.mark.parametrize(
+    ("array", "expected"),
+    [
+        # IDs and fluxes compress best with bzp2, which is not chosen as it
+        # is much slower to decompress
+        (np.arange(100_000), "zlib"),
+        (np.random.default_rng(0).lognormal(size=100_000).astype(np.float32).astype(np.float64), "zlib"),
+        (np.random.default_rng(0).random(100_000), None),
+    ],
+)
+def test_choose_compression(array, expected):
+    assert choose_compression(array) == expected
+
+
+@pytest.mark.parametrize(("slow_size", "expected"), [(460, "fast"), (440, "slow")])
+def test_choose_compression_fastest(slow_size, expected):
+    # A slower codec is only chosen if it shrinks the sample by at least 10%
+    compressors = {"fast": lambda data: bytes(500), "slow": lambda data: bytes(slow_size)}
+    with mk.patch("asdf_astropy._blocks._compressors", return_value=compressors):
+        assert choose_compression(np.zeros(1000)) == expected
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_choose_compression_sample(order):
+    array = np.zeros((2000, 1000), order=order)
+
+    # Only the sample is copied, not the whole (non-contiguous) array
+    tracemalloc.start()
+    try:
+        assert choose_compression(array[::2]) == "zlib"
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < array.nbytes // 10
+
+
+def test_table_compression_errors(tmp_path):
+    table = Table({"a": [1, 2], "t": Time([1, 2], format="mjd")})
+
+    with asdf.AsdfFile({"data": table}) as af:
+        with pytest.raises(ValueError, match=r"Column\(s\) b not found in table"):
+            set_table_compression(af, table, {"b": "zlib"})
+
+        with pytest.raises(TypeError, match="Cannot set the compression of column 't' of type Time"):
+            set_table_compression(af, table, {"t": "zlib"})
+
+    with pytest.raises(ValueError, match="Options 'compression' and 'all_array_compression' are not compatible"):
+        write_table(table, tmp_path / "table.asdf", compression="auto", all_array_compression="zlib")
+
+
 def test_read_table_error(tmp_path):
     file_name = tmp_path / "table.asdf"
 
@@ -94,3 +273,110 @@ def test_write_table_error(tmp_path):
 
     with pytest.raises(ValueError, match="Options 'data_key' and 'make_tree' are not compatible"):
         write_table(mk.MagicMock(), file_name, data_key=mk.MagicMock(), make_tree=mk.MagicMock())
+
+
+def make_chunks(table_class, n_chunks=3):
+    chunks = []
+    for i in range(n_chunks):
+        chunk = table_class(meta={"name": "streamed"})
+        chunk["a"] = np.arange(4) + 4 * i
+        chunk["b"] = MaskedColumn(np.linspace(0, 1, 4), mask=[True, False, False, i == 1])
+        chunk["c"] = np.ones((4, 2)) * i * u.m
+        chunk["d"] = ["w", "x", "y", "z"]
+        chunk["a"].description = "index"
+        chunks.append(chunk)
+    return chunks
+
+
+@pytest.mark.parametrize("table_class", [Table, QTable])
+def test_table_stream_writer(tmp_path, table_class):
+    tmp_file = tmp_path / "table.asdf"
+
+    chunks = make_chunks(table_class)
+    with TableStreamWriter(tmp_file, data_key="table") as writer:
+        for chunk in chunks:
+            writer.append(chunk)
+        assert writer.nrows == 12  # noqa: PLR2004
+
+    with asdf.open(tmp_file) as af:
+        helpers.assert_table_equal(af["table"], vstack(chunks))
+
+
+def test_table_stream_writer_units(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    with TableStreamWriter(tmp_file) as writer:
+        writer.append(QTable({"d": [1.0, 2.0] * u.m}))
+        writer.append(QTable({"d": [1.0, 2.0] * u.km}))
+
+        with pytest.raises(u.UnitConversionError):
+            writer.append(QTable({"d": [1.0, 2.0] * u.s}))
+
+    new_t = QTable.read(tmp_file)
+    assert new_t["d"].unit == u.m
+    np.testing.assert_array_equal(new_t["d"].value, [1, 2, 1000, 2000])
+
+    writer = TableStreamWriter(tmp_file)
+    writer.append(Table({"d": [1.0, 2.0]}, units={"d": u.m}))
+    with pytest.raises(ValueError, match="Column 'd' has unit km, expected m"):
+        writer.append(Table({"d": [1.0, 2.0]}, units={"d": u.km}))
+    writer.close()
+
+
+def test_table_stream_writer_empty(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    with TableStreamWriter(tmp_file) as writer:
+        writer.append(make_table()[:0])
+
+    new_t = Table.read(tmp_file)
+    assert new_t.colnames == ["a", "b", "c"]
+    assert len(new_t) == 0
+
+
+def test_table_stream_writer_exception(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    def write():
+        with TableStreamWriter(tmp_file) as writer:
+            writer.append(make_table())
+            msg = "failed"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        write()
+
+    assert not tmp_file.exists()
+
+
+def test_table_stream_writer_errors(tmp_path):
+    tmp_file = tmp_path / "table.asdf"
+
+    with pytest.raises(ValueError, match="Options 'data_key' and 'make_tree' are not compatible"):
+        TableStreamWriter(tmp_file, data_key=mk.MagicMock(), make_tree=mk.MagicMock())
+
+    writer = TableStreamWriter(tmp_file)
+    table = make_table()
+    writer.append(table)
+
+    with pytest.raises(ValueError, match=r"Column names .* do not match"):
+        writer.append(table["a", "b"])
+
+    with pytest.raises(TypeError, match="Cannot safely cast column 'a'"):
+        writer.append(Table({"a": [1.5], "b": [1.0], "c": ["x"]}))
+
+    writer.close()
+    assert len(Table.read(tmp_file)) == 3  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="Cannot append to a closed TableStreamWriter"):
+        writer.append(table)
+
+
+def test_table_stream_writer_unsupported_column(tmp_path):
+    table = Table({"t": Time([1, 2], format="mjd")})
+
+    with (
+        pytest.raises(TypeError, match="Columns of type Time cannot be streamed"),
+        TableStreamWriter(tmp_path / "table.asdf") as writer,
+    ):
+        writer.append(table)
@@ -0,0 +1,177 @@
+"""
+Proxies for data that is read from an ASDF file on first access.
+"""
+
+import threading
+
+import numpy as np
+
+__all__ = ["LazyQuantity"]
+
+
+class LazyQuantity(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    Proxy for a `~astropy.units.Quantity` whose block has not been read yet.
+
+    The unit, shape and dtype are known from the ndarray node without
+    reading the block.  The block is read the first time the values are
+    needed, after which the proxy forwards everything to the loaded
+    quantity.  As with any lazily loaded array, the values must be
+    accessed while the file is open.
+
+    Instances are returned when reading quantities with the
+    ``lazy_quantity`` option of `asdf_astropy.config.config_context`
+    enabled.  They support arithmetic, numpy functions, indexing and
+    the attributes of `~astropy.units.Quantity`, but are not instances of
+    it; use `load` to get the quantity itself.
+
+    Parameters
+    ----------
+    ndarray : asdf.tags.core.ndarray.NDArrayType
+        The ndarray node of the quantity value.
+    unit : astropy.units.UnitBase
+        The unit of the quantity.
+    """
+
+    def __init__(self, ndarray, unit):
+        self._ndarray = ndarray
+        self._unit = unit
+        self._quantity = None
+        self._lock = threading.Lock()
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def shape(self):
+        return tuple(self._ndarray.shape)
+
+    @property
+    def dtype(self):
+        return np.dtype(self._ndarray.dtype)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def isscalar(self):
+        return False
+
+    @property
+    def loaded(self):
+        """
+        `True` if the block has been read.
+        """
+        return self._quantity is not None
+
+    def load(self):
+        """
+        Read the block, if it has not been read yet, and return the quantity.
+
+        Returns
+        -------
+        astropy.units.Quantity
+        """
+        from asdf_astropy.converters.unit.quantity import make_quantity
+
+        with self._lock:
+            if self._quantity is None:
+                value = self._ndarray._make_array()
+                self._quantity = make_quantity(value, self._unit, value.dtype)
+
+        return self._quantity
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not defined on the proxy
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.load(), name)
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.load().value
+        if dtype is not None:
+            value = value.astype(dtype, copy=False)
+        return np.array(value, copy=True) if copy else value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(load_lazy(value) for value in inputs)
+        if "out" in kwargs:
+            kwargs["out"] = tuple(load_lazy(value) for value in kwargs["out"])
+
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        args = tuple(load_lazy(value) for value in args)
+        kwargs = {key: load_lazy(value) for key, value in kwargs.items()}
+
+        return func(*args, **kwargs)
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __setitem__(self, item, value):
+        self.load()[item] = value
+
+    def __len__(self):
+        if not self.shape:
+            msg = f"{type(self).__name__} of shape () has no len()"
+            raise TypeError(msg)
+        return self.shape[0]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __repr__(self):
+        if self.loaded:
+            return repr(self._quantity)
+
+        return f"<{type(self).__name__} shape={self.shape} dtype={self.dtype} unit={self.unit}>"
+
+    def __str__(self):
+        if self.loaded:
+            return str(self._quantity)
+
+        return repr(self)
+
+
+def load_lazy(value):
+    """
+    Replace `LazyQuantity` proxies with the quantities they stand for.
+
+    Mappings, lists and tuples are searched (but not modified) so that
+    converters can load the proxies nested in their node before building
+    objects that require real quantities.
+
+    Parameters
+    ----------
+    value : object
+
+    Returns
+    -------
+    object
+        The quantity for a proxy, a copy of the container if it contains
+        any proxy, otherwise ``value`` itself.
+    """
+    if isinstance(value, LazyQuantity):
+        return value.load()
+
+    if isinstance(value, dict):
+        loaded = {key: load_lazy(v) for key, v in value.items()}
+        if any(loaded[key] is not v for key, v in value.items()):
+            return loaded
+        return value
+
+    if isinstance(value, (list, tuple)):
+        loaded = [load_lazy(v) for v in value]
+        if any(new is not old for new, old in zip(loaded, value)):
+            return type(value)(loaded) if type(value) in (list, tuple) else loaded
+        return value
+
+    return value
@@ -0,0 +1,294 @@
+"""
+Opt-in instrumentation of the asdf-astropy converters.
+
+Use `profile_converters` to collect the number of calls, the cumulative
+and self time, and the size of the arrays produced for every tag handled
+by the asdf-astropy converters::
+
+    with profile_converters() as profile:
+        with asdf.open("file.asdf") as af:
+            ...
+    print(profile.summary())
+
+Setting the ``ASDF_ASTROPY_PROFILE`` environment variable profiles the
+whole process.  When it is set to a file name the statistics are written
+to that file in `pstats` format when the process exits, otherwise a
+summary is printed to ``stderr``.
+"""
+
+import atexit
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+
+import numpy as np
+
+__all__ = ["ConverterProfile", "profile_converters"]
+
+
+PROFILE_ENV_VAR = "ASDF_ASTROPY_PROFILE"
+
+_CONVERTER_METHODS = {
+    "to_yaml_tree": "write",
+    "from_yaml_tree": "read",
+}
+
+
+class _TagStats:
+    def __init__(self):
+        self.calls = 0
+        self.cumulative = 0.0
+        self.self_time = 0.0
+        self.nbytes = 0
+
+
+class ConverterProfile:
+    """
+    Statistics collected by `profile_converters`.
+
+    The statistics are keyed by ``(direction, tag, converter)`` where
+    ``direction`` is ``"read"`` for ``from_yaml_tree`` and ``"write"``
+    for ``to_yaml_tree`` and ``converter`` is the converter class name.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _record(self, key, calls, cumulative, self_time, nbytes):
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _TagStats()
+            stats.calls += calls
+            stats.cumulative += cumulative
+            stats.self_time += self_time
+            stats.nbytes += nbytes
+
+    @property
+    def stats(self):
+        """
+        Collected statistics.
+
+        Returns
+        -------
+        dict
+            Mapping of ``(direction, tag, converter)`` to a `dict` with
+            ``calls``, ``cumulative`` and ``self`` times in seconds and
+            ``nbytes``, the size of the arrays produced.
+        """
+        with self._lock:
+            return {
+                key: {
+                    "calls": s.calls,
+                    "cumulative": s.cumulative,
+                    "self": s.self_time,
+                    "nbytes": s.nbytes,
+                }
+                for key, s in self._stats.items()
+            }
+
+    def summary(self, sort="cumulative", limit=None):
+        """
+        Format the statistics as a table.
+
+        Parameters
+        ----------
+        sort : str
+            Statistic to sort by, in decreasing order. One of ``"calls"``,
+            ``"cumulative"``, ``"self"`` or ``"nbytes"``.
+        limit : int
+            Optional maximum number of rows.
+
+        Returns
+        -------
+        str
+        """
+        stats = self.stats
+        if stats and sort not in next(iter(stats.values())):
+            msg = f"Unknown sort key '{sort}'"
+            raise ValueError(msg)
+
+        rows = sorted(stats.items(), key=lambda item: item[1][sort], reverse=True)[:limit]
+
+        lines = [f"{'calls':>8} {'cumtime':>10} {'selftime':>10} {'bytes':>14}  {'dir':<5} tag (converter)"]
+        for (direction, tag, converter), s in rows:
+            lines.append(
+                f"{s['calls']:>8} {s['cumulative']:>10.4f} {s['self']:>10.4f} {s['nbytes']:>14}  "
+                f"{direction:<5} {tag} ({converter})",
+            )
+
+        return "\n".join(lines)
+
+    def to_pstats(self):
+        """
+        Convert the statistics to a `pstats.Stats` instance.
+
+        Each ``(direction, tag, converter)`` is reported as a function named
+        ``"<direction> <tag>"`` in a file named after the converter class.
+
+        Returns
+        -------
+        pstats.Stats
+        """
+        entries = {
+            (converter, 0, f"{direction} {tag}"): (s["calls"], s["calls"], s["self"], s["cumulative"], {})
+            for (direction, tag, converter), s in self.stats.items()
+        }
+
+        # pstats refuses to load an empty set of statistics
+        if not entries:
+            return pstats.Stats()
+
+        return pstats.Stats(_StatsSource(entries))
+
+
+class _StatsSource:
+    # pstats.Stats loads the statistics of any object with this interface
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+_DONE = object()
+
+_active_profiles = []
+_install_lock = threading.Lock()
+_local = threading.local()
+
+
+def _child_times():
+    if not hasattr(_local, "child_times"):
+        _local.child_times = []
+    return _local.child_times
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if isinstance(value, dict):
+        return sum(v.nbytes for v in value.values() if isinstance(v, np.ndarray))
+
+    return 0
+
+
+def _record(key, calls, func, *args):
+    child_times = _child_times()
+    child_times.append(0.0)
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        self_time = elapsed - child_times.pop()
+        if child_times:
+            child_times[-1] += elapsed
+
+    nbytes = 0 if isinstance(result, types.GeneratorType) else _nbytes(result)
+    for profile in _active_profiles.copy():
+        profile._record(key, calls, elapsed, self_time, nbytes)
+
+    return result
+
+
+def _profiled_generator(key, generator):
+    # asdf checks for generators, so this must be a real generator
+    while (value := _record(key, 0, next, generator, _DONE)) is not _DONE:
+        yield value
+
+
+def _wrap(converter, method_name):
+    method = getattr(converter, method_name)
+    direction = _CONVERTER_METHODS[method_name]
+    converter_name = type(converter).__name__
+
+    @functools.wraps(method)
+    def wrapper(obj, tag, ctx):
+        key = (direction, tag, converter_name)
+        result = _record(key, 1, method, obj, tag, ctx)
+        if isinstance(result, types.GeneratorType):
+            return _profiled_generator(key, result)
+        return result
+
+    return wrapper
+
+
+def _converters():
+    from . import extensions
+
+    converters = {}
+    for converter in [
+        *extensions.TRANSFORM_CONVERTERS,
+        *extensions.COORDINATES_CONVERTERS,
+        *extensions.ASTROPY_CONVERTERS,
+        *extensions.CORE_CONVERTERS,
+    ]:
+        converters[id(converter)] = converter
+
+    return list(converters.values())
+
+
+def _install(profile):
+    with _install_lock:
+        if not _active_profiles:
+            # Instance attributes shadow the class methods and are
+            # picked up by the asdf converter proxies.
+            for converter in _converters():
+                for method_name in _CONVERTER_METHODS:
+                    setattr(converter, method_name, _wrap(converter, method_name))
+        _active_profiles.append(profile)
+
+
+def _uninstall(profile):
+    with _install_lock:
+        _active_profiles.remove(profile)
+        if not _active_profiles:
+            for converter in _converters():
+                for method_name in _CONVERTER_METHODS:
+                    converter.__dict__.pop(method_name, None)
+
+
+@contextmanager
+def profile_converters():
+    """
+    Context manager that profiles the asdf-astropy converters.
+
+    Profiles can be nested, each one collects the calls made while
+    it is active.
+
+    Yields
+    ------
+    ConverterProfile
+        The statistics, which are updated while the context is active.
+    """
+    profile = ConverterProfile()
+    _install(profile)
+    try:
+        yield profile
+    finally:
+        _uninstall(profile)
+
+
+def _profile_from_environment():
+    value = os.environ.get(PROFILE_ENV_VAR)
+    if not value:
+        return
+
+    profile = ConverterProfile()
+    _install(profile)
+
+    def report():
+        if value.lower() in ("1", "true", "yes"):
+            print(profile.summary(), file=sys.stderr)  # noqa: T201
+        else:
+            profile.to_pstats().dump_stats(value)
+
+    atexit.register(report)
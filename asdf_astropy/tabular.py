@@ -0,0 +1,47 @@
+"""
+Tabular models with more than 2 dimensions.
+
+astropy defines classes for 1D and 2D tabular models
+(`~astropy.modeling.tabular.Tabular1D` and
+`~astropy.modeling.tabular.Tabular2D`), and creates classes for more
+dimensions with `~astropy.modeling.tabular.tabular_model`.  asdf selects
+the converter of an object by its exact class, so the classes created by
+``tabular_model`` cannot be written.  The classes defined here, from 3 to
+10 dimensions, are the N-dimensional tabular models that can be written
+to ASDF files, and are the classes of the models read from them.
+"""
+
+from astropy.modeling.tabular import tabular_model
+
+__all__ = [
+    "Tabular3D",
+    "Tabular4D",
+    "Tabular5D",
+    "Tabular6D",
+    "Tabular7D",
+    "Tabular8D",
+    "Tabular9D",
+    "Tabular10D",
+]
+
+
+def _tabular_class(ndim):
+    model_class = tabular_model(ndim, name=f"Tabular{ndim}D")
+    # Make the class importable from here, which pickle relies on
+    model_class.__module__ = __name__
+    model_class.__doc__ = f"""
+    Tabular model with {ndim} inputs.
+
+    See `~astropy.modeling.tabular.Tabular2D` for the parameters.
+    """
+    return model_class
+
+
+Tabular3D = _tabular_class(3)
+Tabular4D = _tabular_class(4)
+Tabular5D = _tabular_class(5)
+Tabular6D = _tabular_class(6)
+Tabular7D = _tabular_class(7)
+Tabular8D = _tabular_class(8)
+Tabular9D = _tabular_class(9)
+Tabular10D = _tabular_class(10)
@@ -0,0 +1,94 @@
+import os
+
+import asdf
+import numpy as np
+import pytest
+from astropy.modeling import models
+
+from asdf_astropy import config_context
+from asdf_astropy.cache import clear_cache, default_cache_dir, read_cached
+from asdf_astropy.testing import helpers
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    model = models.Shift(1) & models.Scale(3) | models.Polynomial2D(2, c0_0=1, c1_0=2)
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"wcs": {"forward": model}}) as af:
+        af.write_to(file_path)
+
+    return file_path, model
+
+
+def test_read_cached(tmp_path, model_file, monkeypatch):
+    file_path, model = model_file
+    cache_dir = tmp_path / "cache"
+
+    result = read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir)
+    helpers.assert_model_equal(result, model)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        msg = "file should not be opened"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as m:
+        m.setattr(asdf, "open", fail)
+        result = read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir)
+    helpers.assert_model_equal(result, model)
+
+    # A modified file is read again
+    model = models.Shift(2) & models.Scale(3) | models.Polynomial2D(2, c0_0=1, c1_0=2)
+    with asdf.AsdfFile({"wcs": {"forward": model}}) as af:
+        af.write_to(file_path)
+    result = read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir)
+    helpers.assert_model_equal(result, model)
+    assert len(list(cache_dir.glob("*.pickle"))) == 2  # noqa: PLR2004
+
+    clear_cache(cache_dir)
+    assert not list(cache_dir.glob("*.pickle"))
+
+
+def test_read_cached_array(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile({"model": models.Tabular1D(np.arange(10), np.arange(10) * 2.0)}) as af:
+        af.write_to(file_path)
+
+    cache_dir = tmp_path / "cache"
+    read_cached(file_path, "model", cache_dir=cache_dir)
+    result = read_cached(file_path, "model", cache_dir=cache_dir)
+    np.testing.assert_array_equal(result.lookup_table, np.arange(10) * 2.0)
+
+    # Only the block data changes, which is detected by the block checksum
+    with asdf.AsdfFile({"model": models.Tabular1D(np.arange(10), np.arange(10) * 3.0)}) as af:
+        af.write_to(file_path)
+    result = read_cached(file_path, "model", cache_dir=cache_dir)
+    np.testing.assert_array_equal(result.lookup_table, np.arange(10) * 3.0)
+
+
+def test_read_cached_options(tmp_path, model_file):
+    file_path, _ = model_file
+    cache_dir = tmp_path / "cache"
+
+    read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir)
+    read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir, validate_checksums=True)
+    with config_context() as config:
+        config.trusted_read = True
+        read_cached(file_path, ("wcs", "forward"), cache_dir=cache_dir)
+
+    assert len(list(cache_dir.glob("*.pickle"))) == 3  # noqa: PLR2004
+
+
+def test_default_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "asdf_astropy"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires POSIX permissions")
+def test_read_cached_insecure_dir(tmp_path, model_file):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+
+    with pytest.raises(PermissionError, match="must be owned by the current user"):
+        read_cached(model_file[0], ("wcs", "forward"), cache_dir=cache_dir)
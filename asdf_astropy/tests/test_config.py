@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from asdf_astropy import config_context, get_config
+from asdf_astropy.config import AsdfAstropyConfig
+
+
+def test_config_context():
+    assert get_config().decompression_threads is None
+
+    with config_context() as config:
+        config.decompression_threads = 4
+        assert get_config().decompression_threads == 4  # noqa: PLR2004
+
+        with config_context() as inner:
+            assert inner.decompression_threads == 4  # noqa: PLR2004
+            inner.decompression_threads = None
+            assert get_config().decompression_threads is None
+
+        assert get_config().decompression_threads == 4  # noqa: PLR2004
+
+    assert get_config().decompression_threads is None
+
+
+def test_config_context_threaded():
+    results = []
+
+    def check():
+        results.append(get_config().decompression_threads)
+
+    with config_context() as config:
+        config.decompression_threads = 4
+        thread = threading.Thread(target=check)
+        thread.start()
+        thread.join()
+
+    assert results == [None]
+
+
+def test_reset():
+    config = AsdfAstropyConfig()
+    config.decompression_threads = 2
+    config.reset()
+    assert config.decompression_threads is None
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, "2"])
+def test_decompression_threads_invalid(value):
+    with config_context() as config, pytest.raises(ValueError, match="decompression_threads must be"):
+        config.decompression_threads = value
+
+
+def test_array_backend_invalid():
+    with config_context() as config, pytest.raises(ValueError, match="array_backend must be one of"):
+        config.array_backend = "cupy"
@@ -0,0 +1,86 @@
+import asdf
+import numpy as np
+import pytest
+from astropy import units
+from astropy.coordinates import Angle, CartesianRepresentation
+from astropy.modeling.models import Tabular1D
+from astropy.table import QTable
+from astropy.units import Quantity
+from numpy.testing import assert_array_equal
+
+from asdf_astropy import config_context
+from asdf_astropy.lazy import LazyQuantity
+
+
+@pytest.fixture
+def quantity_file(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile() as af:
+        af["quantity"] = Quantity(np.arange(100, dtype=np.int16).reshape(5, 20), units.km, dtype=np.int16)
+        af["scalar"] = Quantity(2.5, units.s)
+        af["angle"] = Angle(np.arange(10), units.deg)
+        af.write_to(file_path)
+
+    return file_path
+
+
+def test_lazy_quantity(quantity_file):
+    with config_context() as config:
+        config.lazy_quantity = True
+        with asdf.open(quantity_file) as af:
+            value = af["quantity"]
+            assert isinstance(value, LazyQuantity)
+            assert value.unit == units.km
+            assert value.shape == (5, 20)
+            assert value.dtype == np.int16
+            assert value.ndim == 2  # noqa: PLR2004
+            assert value.size == 100  # noqa: PLR2004
+            assert len(value) == 5  # noqa: PLR2004
+            assert not value.loaded
+            assert "LazyQuantity" in repr(value)
+
+            expected = Quantity(np.arange(100, dtype=np.int16).reshape(5, 20), units.km, dtype=np.int16)
+            assert_array_equal(value.value, expected.value)
+            assert value.loaded
+            assert isinstance(value.load(), Quantity)
+            assert value.load() is value.load()
+
+            assert_array_equal((value * 2).value, (expected * 2).value)
+            assert (value * 2).unit == units.km
+            assert value.to(units.m)[0, 1] == 1000 * units.m
+            assert value[1, 2] == expected[1, 2]
+            assert np.sum(value) == np.sum(expected)
+            assert_array_equal(Quantity(value), expected)
+
+            # Scalars and subclasses of quantity are not deferred
+            assert isinstance(af["scalar"], Quantity)
+            assert isinstance(af["angle"], Angle)
+
+
+def test_lazy_quantity_off_by_default(quantity_file):
+    with asdf.open(quantity_file) as af:
+        assert isinstance(af["quantity"], Quantity)
+
+
+def test_lazy_quantity_nested(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    table = QTable({"a": np.arange(5) * units.m})
+    representation = CartesianRepresentation(*(np.arange(3) * units.km for _ in range(3)))
+    model = Tabular1D(np.arange(5) * units.pix, np.arange(5) * units.s)
+    with asdf.AsdfFile() as af:
+        af["table"] = table
+        af["representation"] = representation
+        af["model"] = model
+        af.write_to(file_path)
+
+    with config_context() as config:
+        config.lazy_quantity = True
+        with asdf.open(file_path) as af:
+            assert isinstance(af["table"]["a"], Quantity)
+            assert_array_equal(af["table"]["a"], table["a"])
+
+            assert isinstance(af["representation"].x, Quantity)
+            assert_array_equal(af["representation"].x, representation.x)
+
+            assert isinstance(af["model"].lookup_table, Quantity)
+            assert_array_equal(af["model"].lookup_table, model.lookup_table)
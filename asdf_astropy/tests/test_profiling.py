@@ -0,0 +1,80 @@
+import asdf
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.modeling import models
+
+from asdf_astropy import extensions
+from asdf_astropy.profiling import profile_converters
+
+
+def roundtrip(tree, tmp_path):
+    file_path = tmp_path / "test.asdf"
+    with asdf.AsdfFile(tree) as af:
+        af.write_to(file_path)
+
+    with asdf.open(file_path, lazy_load=False) as af:
+        return dict(af.tree)
+
+
+def find_stats(profile, direction, tag_name):
+    return [s for (d, tag, _), s in profile.stats.items() if d == direction and f"/{tag_name}-" in tag]
+
+
+def test_profile_converters(tmp_path):
+    quantity = np.arange(100, dtype=np.float64) * u.m
+    model = models.Shift(1) | models.Scale(2)
+
+    with profile_converters() as profile:
+        roundtrip({"quantity": quantity, "model": model}, tmp_path)
+
+    for direction in ("write", "read"):
+        (quantity_stats,) = find_stats(profile, direction, "quantity")
+        assert quantity_stats["calls"] == 1
+        assert quantity_stats["cumulative"] >= quantity_stats["self"] >= 0
+
+        (compose_stats,) = find_stats(profile, direction, "compose")
+        assert compose_stats["calls"] == 1
+
+        (shift_stats,) = find_stats(profile, direction, "shift")
+        assert shift_stats["calls"] == 1
+
+    (quantity_stats,) = find_stats(profile, "read", "quantity")
+    assert quantity_stats["nbytes"] == quantity.nbytes
+
+    summary = profile.summary(limit=2)
+    assert len(summary.splitlines()) == 3  # noqa: PLR2004
+    assert "QuantityConverter" in profile.summary(sort="nbytes").splitlines()[1]
+
+    stats = profile.to_pstats()
+    assert stats.total_calls == sum(s["calls"] for s in profile.stats.values())
+
+
+def test_profile_converters_restores_converters(tmp_path):
+    with profile_converters() as outer:
+        with profile_converters() as inner:
+            roundtrip({"quantity": 1 * u.m}, tmp_path)
+        roundtrip({"quantity": 1 * u.m}, tmp_path)
+
+    assert find_stats(inner, "write", "quantity")[0]["calls"] == 1
+    assert find_stats(outer, "write", "quantity")[0]["calls"] == 2  # noqa: PLR2004
+
+    for converter in extensions.CORE_CONVERTERS:
+        assert "to_yaml_tree" not in converter.__dict__
+        assert "from_yaml_tree" not in converter.__dict__
+
+    roundtrip({"quantity": 1 * u.m}, tmp_path)
+    assert find_stats(outer, "write", "quantity")[0]["calls"] == 2  # noqa: PLR2004
+
+
+def test_profile_empty():
+    with profile_converters() as profile:
+        pass
+
+    assert profile.stats == {}
+    assert profile.to_pstats().total_calls == 0
+    assert len(profile.summary().splitlines()) == 1
+
+    profile._record(("read", "tag", "Converter"), 1, 0.0, 0.0, 0)
+    with pytest.raises(ValueError, match="Unknown sort key 'foo'"):
+        profile.summary(sort="foo")
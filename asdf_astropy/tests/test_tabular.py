@@ -0,0 +1,45 @@
+import pickle
+import subprocess
+import sys
+
+import asdf
+import numpy as np
+import pytest
+from astropy.modeling.tabular import tabular_model
+
+from asdf_astropy.tabular import Tabular3D
+
+
+def _run(code, stdin=None):
+    # Run in a new interpreter, where astropy.modeling is not imported yet
+    return subprocess.run([sys.executable, "-c", code], input=stdin, capture_output=True, check=True).stdout  # noqa: S603
+
+
+def _model():
+    shape = (2, 3, 4)
+    return Tabular3D(
+        points=tuple(np.arange(n, dtype=float) for n in shape),
+        lookup_table=np.arange(np.prod(shape), dtype=float).reshape(shape),
+    )
+
+
+def test_import_fresh_process():
+    assert _run("from asdf_astropy.tabular import Tabular3D; print(Tabular3D.n_inputs)") == b"3\n"
+
+
+def test_pickle_fresh_process():
+    model = _model()
+
+    code = "import pickle, sys; print(pickle.load(sys.stdin.buffer)(0.5, 1.5, 1.5))"
+    assert float(_run(code, pickle.dumps(model))) == model(0.5, 1.5, 1.5)
+
+
+def test_write_tabular_model_class(tmp_path):
+    model = _model()
+    with asdf.AsdfFile({"model": model}) as af:
+        af.write_to(tmp_path / "test.asdf")
+
+    # Other classes created by tabular_model cannot be written
+    other = tabular_model(3, name="Tabular3D")(points=model.points, lookup_table=model.lookup_table)
+    with pytest.raises(asdf.exceptions.AsdfSerializationError), asdf.AsdfFile({"model": other}) as af:
+        af.write_to(tmp_path / "other.asdf")
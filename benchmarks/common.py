@@ -0,0 +1,50 @@
+"""
+Helpers shared by the converter benchmarks.
+
+Each benchmark class builds an object in ``setup`` and measures the time
+and peak memory of serializing it to, and deserializing it from, an
+in-memory ASDF file.
+"""
+
+import io
+
+import asdf
+
+
+def serialize(obj, **kwargs):
+    """
+    Write an object to an in-memory ASDF file.
+
+    Parameters
+    ----------
+    obj : object
+        Object to store under the ``obj`` key of the tree.
+    **kwargs
+        Passed to `asdf.AsdfFile.write_to`.
+
+    Returns
+    -------
+    bytes
+        Contents of the ASDF file.
+    """
+    buff = io.BytesIO()
+    with asdf.AsdfFile({"obj": obj}) as af:
+        af.write_to(buff, **kwargs)
+
+    return buff.getvalue()
+
+
+def deserialize(contents):
+    """
+    Read an object written by `serialize`, including all of its array data.
+
+    Parameters
+    ----------
+    contents : bytes
+
+    Returns
+    -------
+    object
+    """
+    with asdf.open(io.BytesIO(contents), lazy_load=False, memmap=False) as af:
+        return af["obj"]
@@ -0,0 +1,60 @@
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import CIRS, ICRS, SkyCoord
+
+from .common import deserialize, serialize
+
+
+class SkyCoordBenchmarks:
+    params = [10**3, 10**7]
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        rng = np.random.default_rng(42)
+        self.coord = SkyCoord(rng.uniform(0, 360, size) * u.deg, rng.uniform(-90, 90, size) * u.deg)
+        self.contents = serialize(self.coord)
+
+    def time_serialize(self, size):
+        serialize(self.coord)
+
+    def time_deserialize(self, size):
+        deserialize(self.contents)
+
+    def peakmem_serialize(self, size):
+        serialize(self.coord)
+
+    def peakmem_deserialize(self, size):
+        deserialize(self.contents)
+
+
+class FrameBenchmarks:
+    params = [10, 1000]
+    param_names = ["n_frames"]
+
+    def setup(self, n_frames):
+        self.frames = [ICRS() for _ in range(n_frames)]
+        self.contents = serialize(self.frames)
+
+    def time_serialize(self, n_frames):
+        serialize(self.frames)
+
+    def time_deserialize(self, n_frames):
+        deserialize(self.contents)
+
+
+class FrameAttributeBenchmarks:
+    # Frames with attributes, many of them as in files with a large number
+    # of coordinate frames (gwcs CelestialFrame for example)
+    params = [10**3, 10**4]
+    param_names = ["n_frames"]
+
+    def setup(self, n_frames):
+        self.frames = [CIRS() for _ in range(n_frames)]
+        self.contents = serialize(self.frames)
+
+    def time_serialize(self, n_frames):
+        serialize(self.frames)
+
+    def time_deserialize(self, n_frames):
+        deserialize(self.contents)
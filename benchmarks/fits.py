@@ -0,0 +1,26 @@
+import numpy as np
+from astropy.io import fits
+
+from .common import deserialize, serialize
+
+
+class HDUListBenchmarks:
+    params = [100, 10_000]
+    param_names = ["n_cards"]
+
+    def setup(self, n_cards):
+        header = fits.Header([(f"KEY{i}", i, f"comment {i}") for i in range(n_cards)])
+        self.hdulist = fits.HDUList([fits.PrimaryHDU(header=header), fits.ImageHDU(data=np.zeros((100, 100)))])
+        self.contents = serialize(self.hdulist)
+
+    def time_serialize(self, n_cards):
+        serialize(self.hdulist)
+
+    def time_deserialize(self, n_cards):
+        deserialize(self.contents)
+
+    def peakmem_serialize(self, n_cards):
+        serialize(self.hdulist)
+
+    def peakmem_deserialize(self, n_cards):
+        deserialize(self.contents)
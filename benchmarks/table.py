@@ -0,0 +1,31 @@
+import astropy.units as u
+import numpy as np
+from astropy.table import QTable, Table
+
+from .common import deserialize, serialize
+
+
+class TableBenchmarks:
+    params = ([Table, QTable], [10, 300])
+    param_names = ["table_class", "n_columns"]
+
+    n_rows = 10_000
+
+    def setup(self, table_class, n_columns):
+        rng = np.random.default_rng(42)
+        self.table = table_class()
+        for i in range(n_columns):
+            self.table[f"col{i}"] = rng.random(self.n_rows) * u.Jy
+        self.contents = serialize(self.table)
+
+    def time_serialize(self, table_class, n_columns):
+        serialize(self.table)
+
+    def time_deserialize(self, table_class, n_columns):
+        deserialize(self.contents)
+
+    def peakmem_serialize(self, table_class, n_columns):
+        serialize(self.table)
+
+    def peakmem_deserialize(self, table_class, n_columns):
+        deserialize(self.contents)
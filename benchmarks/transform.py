@@ -0,0 +1,67 @@
+import numpy as np
+from astropy.modeling import models
+
+from .common import deserialize, serialize
+
+
+class CompoundModelBenchmarks:
+    params = ([10, 100], ["|", "&"])
+    param_names = ["depth", "operator"]
+
+    def setup(self, depth, operator):
+        model = models.Shift(1)
+        for i in range(depth):
+            if operator == "|":
+                model |= models.Scale(i + 2)
+            else:
+                model &= models.Scale(i + 2)
+        self.model = model
+        self.contents = serialize(self.model)
+
+    def time_serialize(self, depth, operator):
+        serialize(self.model)
+
+    def time_deserialize(self, depth, operator):
+        deserialize(self.contents)
+
+
+class Polynomial2DBenchmarks:
+    params = [5, 20]
+    param_names = ["degree"]
+
+    def setup(self, degree):
+        self.model = models.Polynomial2D(degree)
+        self.model.parameters = np.arange(len(self.model.parameters))
+        self.contents = serialize(self.model)
+
+    def time_serialize(self, degree):
+        serialize(self.model)
+
+    def time_deserialize(self, degree):
+        deserialize(self.contents)
+
+
+class SharedSubmodelBenchmarks:
+    params = [10, 100]
+    param_names = ["detectors"]
+
+    def setup(self, detectors):
+        distortion = models.Polynomial2D(10)
+        distortion.parameters = np.arange(len(distortion.parameters))
+        pipeline = models.Mapping((1, 0)) | distortion
+        model = pipeline
+        for _ in range(detectors - 1):
+            model &= pipeline
+        self.model = model
+        self.contents = serialize(self.model)
+
+    def time_serialize(self, detectors):
+        serialize(self.model)
+
+    def time_deserialize(self, detectors):
+        deserialize(self.contents)
+
+    def track_size(self, detectors):
+        return len(self.contents)
+
+    track_size.unit = "bytes"
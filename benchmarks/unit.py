@@ -0,0 +1,41 @@
+import astropy.units as u
+import numpy as np
+
+from .common import deserialize, serialize
+
+
+class QuantityBenchmarks:
+    params = [10**4, 10**7]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.quantity = np.arange(size, dtype=np.float64) * u.Jy
+        self.contents = serialize(self.quantity)
+
+    def time_serialize(self, size):
+        serialize(self.quantity)
+
+    def time_deserialize(self, size):
+        deserialize(self.contents)
+
+    def peakmem_serialize(self, size):
+        serialize(self.quantity)
+
+    def peakmem_deserialize(self, size):
+        deserialize(self.contents)
+
+
+class UnitBenchmarks:
+    params = [10, 1000]
+    param_names = ["n_units"]
+
+    def setup(self, n_units):
+        units = [u.Jy, u.deg, u.m / u.s, u.erg / u.s / u.cm**2 / u.AA]
+        self.units = [units[i % len(units)] for i in range(n_units)]
+        self.contents = serialize(self.units)
+
+    def time_serialize(self, n_units):
+        serialize(self.units)
+
+    def time_deserialize(self, n_units):
+        deserialize(self.contents)
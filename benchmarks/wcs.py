@@ -0,0 +1,31 @@
+import numpy as np
+from astropy.wcs import WCS, Sip
+
+from .common import deserialize, serialize
+
+
+class SipWCSBenchmarks:
+    params = [5, 10]
+    param_names = ["sip_order"]
+
+    def setup(self, sip_order):
+        rng = np.random.default_rng(42)
+        wcs = WCS(naxis=2)
+        wcs.wcs.crval = [251.29, 57.58]
+        wcs.wcs.cdelt = [1, 1]
+        wcs.wcs.crpix = [507, 507]
+        wcs.wcs.pc = np.array([[7.7e-6, 3.3e-5], [3.7e-5, -6.8e-6]])
+        wcs.wcs.ctype = ["RA---TAN-SIP", "DEC--TAN-SIP"]
+        shape = (sip_order + 1, sip_order + 1)
+        a = rng.uniform(low=-1e-5, high=1e-5, size=shape)
+        b = rng.uniform(low=-1e-5, high=1e-5, size=shape)
+        wcs.sip = Sip(a, b, None, None, wcs.wcs.crpix)
+        wcs.wcs.set()
+        self.wcs = wcs
+        self.contents = serialize(self.wcs)
+
+    def time_serialize(self, sip_order):
+        serialize(self.wcs)
+
+    def time_deserialize(self, sip_order):
+        deserialize(self.contents)